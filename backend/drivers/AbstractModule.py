@@ -1,11 +1,131 @@
 """Base module class for all video source drivers."""
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, quote_plus
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 import logging
+import string
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Tree builder used by every driver; libxml2-backed and much faster than html.parser.
+HTML_PARSER = 'lxml'
+
+# Default cap on the results a parser returns from one page. Search pages list
+# 20-50 results; parsers stop extracting once they have this many.
+MAX_RESULTS_PER_PAGE = 60
+
+# One tree builder per thread; builders keep per-parse state so they are not shared
+_builders = threading.local()
+
+
+def _tree_builder():
+    """Return this thread's reusable HTML_PARSER tree builder.
+
+    Falls back to the stdlib html.parser builder when lxml is not installed.
+    """
+    builder = getattr(_builders, 'builder', None)
+    if builder is None:
+        builder_class = builder_registry.lookup(HTML_PARSER)
+        if builder_class is None:
+            logger.warning("%s tree builder unavailable; falling back to html.parser", HTML_PARSER)
+            builder_class = builder_registry.lookup('html.parser')
+        builder = builder_class()
+        _builders.builder = builder
+    return builder
+
+
+def class_strainer(tag, *classes: str) -> SoupStrainer:
+    """SoupStrainer for ``tag`` elements carrying any of ``classes``.
+
+    At parse time the strainer sees the raw ``class`` attribute string, so a
+    plain ``class_=[...]`` filter misses multi-class elements; split it here.
+    """
+    wanted = frozenset(classes)
+
+    def _has_class(value: Optional[str]) -> bool:
+        return value is not None and not wanted.isdisjoint(value.split())
+
+    return SoupStrainer(tag, class_=_has_class)
+
+
+# Characters quote_plus() leaves alone, plus the space it maps to '+'
+_QUERY_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + ' -_.')
+
+
+def quote_query(query: str) -> str:
+    """quote_plus() with a fast path for plain alphanumeric queries."""
+    if _QUERY_SAFE_CHARS.issuperset(query):
+        return query.replace(' ', '+')
+    return quote_plus(query)
+
+
+def first_text(item, selectors) -> Optional[str]:
+    """Return the text of the first selector match that has any.
+
+    Args:
+        item (Tag): The element to search within.
+        selectors: ``(tag, css_class)`` pairs in priority order; a None ``css_class``
+            matches ``tag`` whatever its class.
+
+    Returns:
+        Optional[str]: The stripped text, or None if no candidate has text.
+    """
+    for tag, css_class in selectors:
+        # class_=None would only match tags without a class attribute
+        elem = item.find(tag) if css_class is None else item.find(tag, class_=css_class)
+        if elem is not None:
+            text = elem.get_text(strip=True)
+            if text:
+                return text
+    return None
+
+
+def find_by_class(item, names, *predicates) -> List[Optional[Any]]:
+    """Find the first element matching each class predicate in one subtree walk.
+
+    Equivalent to ``[item.find(names, class_=p) for p in predicates]``, but the
+    descendants are visited once and the walk stops as soon as every predicate
+    has a match. An element may satisfy several predicates.
+
+    Args:
+        item (Tag): The element to search within.
+        names: Tag names the matches may have.
+        *predicates: Callables taking one class token (or None) and returning bool.
+
+    Returns:
+        List[Optional[Tag]]: One entry per predicate, None where nothing matched.
+    """
+    found: List[Optional[Any]] = [None] * len(predicates)
+    pending = len(predicates)
+    for elem in item.descendants:
+        if elem.name not in names:
+            continue
+        classes = elem.get('class') or (None,)
+        for i, predicate in enumerate(predicates):
+            if found[i] is None and any(predicate(c) for c in classes):
+                found[i] = elem
+                pending -= 1
+        if not pending:
+            break
+    return found
+
+
+@lru_cache(maxsize=64)
+def _url_origin(base: str) -> str:
+    """Return the scheme://netloc part of a base URL."""
+    parts = urlparse(base)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+@lru_cache(maxsize=4096)
+def _cached_urljoin(base: str, url: str) -> str:
+    """Memoized urljoin; drivers resolve the same few bases over and over."""
+    return urljoin(base, url)
+
 
 class AbstractModule(ABC):
     """Abstract base class for video source drivers.
@@ -45,20 +165,24 @@ class AbstractModule(ABC):
         Returns:
             str: The constructed URL for the video search.
         """
-        logger.debug(f"Generating video URL for query='{query}', page={page}")
         pass
     
     @abstractmethod
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
                                   represents a video and contains extracted details
                                   like title, URL, thumbnail, duration, views, etc.
+                                  The server validates these into Video models;
+                                  a dict without str 'id', 'title', 'url',
+                                  'thumbnail' and 'source' values is dropped.
         """
         pass
     
@@ -87,6 +211,37 @@ class AbstractModule(ABC):
         logger.debug(f"Parsing HTML for {self.name} GIF results...")
         return []
     
+    def parse_html(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Build the document tree for a search results page.
+
+        Args:
+            html (str): The HTML content of the search results page.
+            parse_only (Optional[SoupStrainer]): Restrict the tree to matching
+                                                 elements (and their descendants).
+
+        Returns:
+            BeautifulSoup: The parsed document, built with HTML_PARSER.
+        """
+        builder = _tree_builder()
+        soup = BeautifulSoup(html, builder=builder, parse_only=parse_only)
+        # Don't pin the last parsed document to the thread's builder
+        builder.soup = None
+        return soup
+    
+    @staticmethod
+    def release_tree(soup: Optional[BeautifulSoup]) -> None:
+        """Tear down a parsed tree as soon as the parser is done with it.
+
+        Tags reference their parents and children, so a dropped tree is only
+        reclaimed by the cyclic garbage collector; decompose() breaks those
+        links and frees it right away.
+
+        Args:
+            soup (Optional[BeautifulSoup]): The tree to release; None is ignored.
+        """
+        if soup is not None:
+            soup.decompose()
+    
     def make_absolute(self, url: str, base: str) -> Optional[str]:
         """Convert relative URLs to absolute URLs, handling various cases.
 
@@ -102,23 +257,31 @@ class AbstractModule(ABC):
         
         url = url.strip()
         
+        # Dispatch on the first character so the common relative case skips
+        # the scheme checks entirely
+        first = url[:1]
+        
+        if first == '/':
+            # Handle protocol-relative URLs
+            if url.startswith('//'):
+                return f'https:{url}'
+            # Fast path for root-relative paths, the common case on search pages
+            if '/.' not in url:
+                return _url_origin(base) + url
+        
         # Handle data URLs
-        if url.startswith('data:'):
+        elif first == 'd' and url.startswith('data:'):
             return url
         
-        # Handle protocol-relative URLs
-        if url.startswith('//'):
-            return f'https:{url}'
-        
         # Handle absolute URLs
-        if url.startswith(('http://', 'https://')):
+        elif first == 'h' and url.startswith(('http://', 'https://')):
             return url
         
         # Handle relative URLs
         try:
-            return urljoin(base, url)
+            return _cached_urljoin(base, url)
         except Exception as e:
-            logger.error(f"{self.name}: Failed to resolve URL: {url} with base: {base}. Error: {str(e)}")
+            logger.error("%s: Failed to resolve URL: %s with base: %s. Error: %s", self.name, url, base, e)
             return None
     
     def normalize_duration(self, duration: str) -> str:
@@ -128,11 +291,9 @@ class AbstractModule(ABC):
             duration (str): The raw duration string extracted from the HTML.
 
         Returns:
-            str: A normalized duration string (e.g., 'N/A' if empty).
+            str: A normalized duration string (e.g., 'N/A' if empty or blank).
         """
-        if not duration:
-            return 'N/A'
-        return duration.strip()
+        return (duration or '').strip() or 'N/A'
     
     def normalize_views(self, views: str) -> str:
         """Normalize views count format to a consistent string representation.
@@ -141,9 +302,6 @@ class AbstractModule(ABC):
             views (str): The raw views count string extracted from the HTML.
 
         Returns:
-            str: A normalized views count string (e.g., '0' if empty).
+            str: A normalized views count string (e.g., '0' if empty or blank).
         """
-        logger.debug(f"Normalizing views: '{views}'")
-        normalized = '0' if not views else views.strip()
-        logger.debug(f"Normalized views: '{normalized}'")
-        return normalized
\ No newline at end of file
+        return (views or '').strip() or '0'
\ No newline at end of file
@@ -1,16 +1,41 @@
 """Eporner video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode, quote_plus
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, quote_query, class_strainer, find_by_class
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.eporner.com'
 
+_HREF_RE = re.compile(r'/video-')
+_VIDEO_ID_RE = re.compile(r'/video-([a-zA-Z0-9]+)/')
+
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('div', 'mb', 'video-box', 'thumbwook')
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build the search URL for an already-stripped query; memoized for repeat searches."""
+    return f"{BASE_PLATFORM_URL}/search/{quote_query(query)}/{page}/"
+
+
+# Tags that may hold the duration / view-count text
+_META_TAGS = ('span', 'div')
+
+
+def _is_duration_class(css_class: Optional[str]) -> bool:
+    """Match duration containers; plain substring checks beat a regex per class token."""
+    return css_class is not None and ('dur' in css_class or 'time' in css_class or 'length' in css_class)
+
+
+def _is_views_class(css_class: Optional[str]) -> bool:
+    """Match view-count containers by class name."""
+    return css_class is not None and ('view' in css_class or 'count' in css_class)
+
 
 class EpornerDriver(AbstractModule):
     """Driver for Eporner platform.
@@ -39,15 +64,16 @@ class EpornerDriver(AbstractModule):
         Returns:
             str: The constructed URL for the video search on Eporner.
         """
-        page = max(1, page if page else self1.first_page)
-        query_encoded = quote_plus(query.strip())
-        return f"{BASE_PLATFORM_URL}/search/{query_encoded}/{page}/"
+        page = max(1, page if page else self.first_page)
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of an Eporner search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -56,69 +82,71 @@ class EpornerDriver(AbstractModule):
                                   Returns an empty list if parsing fails or no items are found.
         """
         results = []
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
             
             # Eporner uses div.mb or div.video-box for video items
             items = soup.find_all('div', class_=['mb', 'video-box', 'thumbwook'])
             if not items:
-                logger.warning(f"{self.name}: No video items found in HTML.")
+                logger.warning("%s: No video items found in HTML.", source)
                 return results
             
             for item in items:
                 try:
-                    link = item.find('a', href=re.compile(r'/video-'))
-                    if not link:
+                    link = item.find('a', href=_HREF_RE)
+                    if link is None:
                         continue
                     
-                    # Extract URL and ID
+                    # Extract URL and ID; cheapest checks first so rejected items
+                    # never pay for the subtree walks below
                     url = link.get('href', '')
-                    match = re.search(r'/video-([a-zA-Z0-9]+)/', url)
+                    match = _VIDEO_ID_RE.search(url)
                     video_id = match.group(1) if match else None
                     
+                    # Extract thumbnail
+                    thumb = None
+                    if video_id:
+                        img = item.find('img')
+                        if img is not None:
+                            attrs = img.attrs
+                            thumb = attrs.get('data-src') or attrs.get('data-original') or attrs.get('src')
+                    
+                    # Validate essential fields
+                    if not video_id or not url or not thumb:
+                        logger.warning("%s: Skipping item due to missing essential fields (id, url, or thumb). URL: %s", source, url)
+                        continue
+                    
                     # Extract title - multiple possible locations
-                    title = (
-                        link.get('title') or
-                        item.find('div', class_='title').get_text(strip=True) if item.find('div', class_='title') else None or
-                        item.find('span', class_='title').get_text(strip=True) if item.find('span', class_='title') else None or
-                        link.get_text(strip=True) or
-                        'Untitled Video'
-                    )
+                    # Only walk the item subtree when the link has no title, and
+                    # look for div.title/span.title in a single pass
+                    title = link.get('title')
+                    if not title:
+                        title_elem = item.find(['div', 'span'], class_='title')
+                        title = (
+                            (title_elem.get_text(strip=True) if title_elem is not None else None) or
+                            link.get_text(strip=True) or
+                            'Untitled Video'
+                        )
                     
                     # Clean title
                     title = title.strip()
                     if not title or title.lower() == 'untitled':
                         title = 'Eporner Video'
                     
-                    # Extract thumbnail
-                    img = item.find('img')
-                    thumb = None
-                    if img:
-                        thumb = img.get('data-src') or img.get('data-original') or img.get('src')
-                    
-                    # Extract duration
-                    duration_elem = item.find(['span', 'div'], class_=re.compile(r'dur|time|length'))
-                    duration = 'N/A'
-                    if duration_elem:
-                        duration = duration_elem.get_text(strip=True)
-                    
-                    # Extract views
-                    views_elem = item.find(['span', 'div'], class_=re.compile(r'view|count'))
-                    views = None
-                    if views_elem:
-                        views = views_elem.get_text(strip=True)
-                    
-                    # Validate essential fields
-                    if not video_id or not url or not thumb:
-                        logger.warning(f"{self    .name}: Skipping item due to missing essential fields (id, url, or thumb). URL: {url}")
-                        continue
+                    # Extract duration and views from a single walk of the item
+                    duration_elem, views_elem = find_by_class(item, _META_TAGS, _is_duration_class, _is_views_class)
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
+                    views = views_elem.get_text(strip=True) if views_elem is not None else None
                     
                     # Make URLs absolute
                     url = self.make_absolute(url, BASE_PLATFORM_URL)
                     thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
                     
                     if not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to failed URL absolute conversion. URL: {url}, Thumb: {thumb}")
+                        logger.warning("%s: Skipping item due to failed URL absolute conversion. URL: %s, Thumb: %s", source, url, thumb)
                         continue
                     
                     results.append({
@@ -128,16 +156,20 @@ class EpornerDriver(AbstractModule):
                         'thumbnail': thumb,
                         'duration': duration,
                         'views': views,
-                        'source': self.name,
+                        'source': source,
                         'type': 'video'
                     })
+                    if len(results) >= limit:
+                        break
                 
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing video item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing video item: %r", source, e)
                     continue
         
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
+        finally:
+            self.release_tree(soup)
         
         return results
\ No newline at end of file
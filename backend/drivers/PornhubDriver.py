@@ -1,17 +1,44 @@
 """Pornhub video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode, quote_plus
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, quote_query, class_strainer
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.pornhub.com'
 GIF_DOMAIN = 'https://i.pornhub.com'
 
+_VIEWKEY_RE = re.compile(r'viewkey=([a-zA-Z0-9]+)')
+_GIF_ID_RE = re.compile(r'/(\d+)/(\w+)')
+
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('div', 'phimage')
+_GIF_STRAINER = class_strainer('div', 'gifImageBlock', 'img-container')
+
+# Literal class token every video container carries; pages without it have no results
+_ITEM_MARKER = 'phimage'
+
+# Search results live in ul#videoSearchResult; everything before it is site chrome
+_RESULTS_ANCHOR = 'id="videoSearchResult"'
+
+
+def _results_region(html: str) -> str:
+    """Drop the markup preceding the search result list, if the list is present."""
+    anchor = html.find(_RESULTS_ANCHOR)
+    if anchor == -1:
+        return html
+    start = html.rfind('<', 0, anchor)
+    return html[start:] if start != -1 else html
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(section: str, query: str, page: int) -> str:
+    """Build a /video or /gifs search URL for an already-stripped query; memoized."""
+    return f"{BASE_PLATFORM_URL}/{section}/search?search={quote_query(query)}&page={page}"
+
 
 class PornhubDriver(AbstractModule):
     """Driver for Pornhub video platform.
@@ -41,18 +68,15 @@ class PornhubDriver(AbstractModule):
             str: The constructed URL for the video search on Pornhub.
         """
         page = max(1, page if page else self.first_page)
-        params = {
-            'search': query.strip(),
-            'page': str(page)
-        }
-        logger.debug(f"Pornhub video URL: query='{query}', page={page}")
-        return f"{BASE_PLATFORM_URL}/video/search?{urlencode(params)}"
+        return _build_search_url('video', query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a Pornhub video search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -60,56 +84,69 @@ class PornhubDriver(AbstractModule):
                                   like title, URL, thumbnail, duration, views, etc.
         """
         results = []
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        # An empty search page never contains the marker; skip region slicing and parsing
+        if _ITEM_MARKER not in html:
+            logger.warning("%s: No video items found in HTML.", source)
+            return results
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(_results_region(html), parse_only=_VIDEO_STRAINER)
             
             items = soup.find_all('div', class_='phimage')
             if not items:
-                logger.warning(f"{self.name}: No video items found in HTML.")
+                logger.warning("%s: No video items found in HTML.", source)
                 return results
             
             for item in items:
                 try:
                     link = item.find('a')
-                    if not link:
+                    if link is None:
                         continue
                     
-                    # Extract URL and ID
+                    # Extract URL and ID; cheapest checks first so rejected items
+                    # never pay for the subtree walks below
                     url = link.get('href', '')
-                    match = re.search(r'viewkey=([a-zA-Z0-9]+)', url)
+                    match = _VIEWKEY_RE.search(url)
                     video_id = match.group(1) if match else None
                     
-                    # Extract title
-                    title = (
-                        link.get('title') or 
-                        item.find('span', class_='title').get_text(strip=True) if item.find('span', class_='title') else None or
-                        item.get('data-video-title') or
-                        'Untitled Video'
-                    )
+                    # Validate essential fields
+                    if not video_id or not url:
+                        logger.warning("%s: Skipping item due to missing essential fields (id or url). URL: %s", source, url)
+                        continue
                     
                     # Extract thumbnail
                     img = item.find('img')
-                    thumb = img.get('data-src') or img.get('src') if img else None
-                    
-                    # Extract duration
-                    duration_elem = item.find(['var', 'span'], class_='duration')
-                    duration = duration_elem.get_text(strip=True) if duration_elem else 'N/A'
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('src')
                     
                     # Skip invalid thumbnails
                     if not thumb or 'nothumb' in thumb:
                         continue
                     
-                    # Validate essential fields
-                    if not video_id or not url or not title or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to missing essential fields (id, url, title, or thumb). URL: {url}")
-                        continue
+                    # Extract title
+                    title = link.get('title')
+                    if not title:
+                        title_elem = item.find('span', class_='title')
+                        title = (
+                            (title_elem.get_text(strip=True) if title_elem is not None else None) or
+                            item.get('data-video-title') or
+                            'Untitled Video'
+                        )
+                    
+                    # Extract duration
+                    duration_elem = item.find(['var', 'span'], class_='duration')
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
                     
                     # Make URLs absolute
                     url = self.make_absolute(url, BASE_PLATFORM_URL)
                     thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
                     
                     if not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to failed URL absolute conversion. URL: {url}, Thumb: {thumb}")
+                        logger.warning("%s: Skipping item due to failed URL absolute conversion. URL: %s, Thumb: %s", source, url, thumb)
                         continue
                     
                     results.append({
@@ -118,17 +155,21 @@ class PornhubDriver(AbstractModule):
                         'url': url,
                         'thumbnail': thumb,
                         'duration': duration,
-                        'source': self.name,
+                        'source': source,
                         'type': 'video'
                     })
+                    if len(results) >= limit:
+                        break
                 
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing video item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing video item: %r", source, e)
                     continue
         
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
+        finally:
+            self.release_tree(soup)
         
         return results
     
@@ -143,12 +184,7 @@ class PornhubDriver(AbstractModule):
             str: The constructed URL for the GIF search on Pornhub.
         """
         page = max(1, page if page else self.first_page)
-        params = {
-            'search': query.strip(),
-            'page': str(page)
-        }
-        logger.debug(f"Pornhub GIF URL: query='{query}', page={page}")
-        return f"{BASE_PLATFORM_URL}/gifs/search?{urlencode(params)}"
+        return _build_search_url('gifs', query.strip(), page)
     
     def gif_parser(self, html: str) -> List[Dict[str, Any]]:
         """Parse the HTML content of a Pornhub GIF search results page to extract GIF data.
@@ -162,37 +198,36 @@ class PornhubDriver(AbstractModule):
                                   like title, URL, thumbnail, etc.
         """
         results = []
+        source = self.name
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html, parse_only=_GIF_STRAINER)
             
             items = soup.find_all('div', class_=['gifImageBlock', 'img-container'])
             if not items:
-                logger.warning(f"{self.name}: No GIF items found in HTML.")
+                logger.warning("%s: No GIF items found in HTML.", source)
                 return results
             
             for item in items:
                 try:
                     link = item.find('a')
-                    if not link:
+                    if link is None:
                         continue
                     
                     # Extract URL and ID
                     page_url = link.get('href', '')
                     gif_id = item.get('data-id')
                     if not gif_id and page_url:
-                        match = re.search(r'/(\d+)/(\w+)', page_url)
+                        match = _GIF_ID_RE.search(page_url)
                         gif_id = match.group(1) if match else None
                     
                     # Extract title
                     img = item.find('img')
-                    title = (
-                        img.get('alt') if img else None or
-                        link.get('title') or
-                        'Untitled GIF'
-                    )
+                    attrs = img.attrs if img is not None else {}
+                    title = attrs.get('alt') or link.get('title') or 'Untitled GIF'
                     
                     # Extract animated GIF URL
-                    animated = img.get('data-src') or img.get('src') if img else None
+                    animated = attrs.get('data-src') or attrs.get('src')
                     
                     if animated and animated.endswith('.gif'):
                         animated = self.make_absolute(animated, GIF_DOMAIN)
@@ -201,14 +236,14 @@ class PornhubDriver(AbstractModule):
                     
                     # Validate essential fields
                     if not gif_id or not page_url or not animated:
-                        logger.warning(f"{self.name}: Skipping GIF item due to missing essential fields (id, url, or animated URL). URL: {page_url}")
+                        logger.warning("%s: Skipping GIF item due to missing essential fields (id, url, or animated URL). URL: %s", source, page_url)
                         continue
                     
                     # Make URLs absolute
                     page_url = self.make_absolute(page_url, BASE_PLATFORM_URL)
                     
                     if not page_url:
-                        logger.warning(f"{self.name}: Skipping GIF item due to failed URL absolute conversion. URL: {page_url}")
+                        logger.warning("%s: Skipping GIF item due to failed URL absolute conversion. URL: %s", source, page_url)
                         continue
                     
                     results.append({
@@ -217,16 +252,20 @@ class PornhubDriver(AbstractModule):
                         'url': page_url,
                         'thumbnail': animated,
                         'preview_video': animated,
-                        'source': self.name,
+                        'source': source,
                         'type': 'gif'
                     })
+                    if len(results) >= MAX_RESULTS_PER_PAGE:
+                        break
                 
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing GIF item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing GIF item: %r", source, e)
                     continue
         
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content for GIFs. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content for GIFs. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
+        finally:
+            self.release_tree(soup)
         
         return results
@@ -1,16 +1,37 @@
 """Redtube video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, quote_query, class_strainer
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.redtube.com'
 
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('li', 'video_li')
+
+# Class token present on every result <li>; its absence means an empty results page
+_ITEM_MARKER = 'video_li'
+
+
+# Leading digits of a path segment; tolerates hrefs like '/12345?pkey=...' or '/12345#x'
+_VIDEO_ID_RE = re.compile(r'/(\d+)')
+
+
+def _video_id(url: str) -> Optional[str]:
+    """Return the numeric id of a Redtube video URL (e.g. '/12345'), or None."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build a Redtube search URL for an already-stripped query (memoized)."""
+    return f"{BASE_PLATFORM_URL}/?search={quote_query(query)}&page={page}"
+
 
 class RedtubeDriver(AbstractModule):
     """Driver for Redtube platform.
@@ -40,17 +61,15 @@ class RedtubeDriver(AbstractModule):
             str: The constructed URL for the video search on Redtube.
         """
         page = max(1, page if page else self.first_page)
-        params = {
-            'search': query.strip(),
-            'page': str(page)
-        }
-        return f"{BASE_PLATFORM_URL}/?{urlencode(params)}"
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a Redtube search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -59,40 +78,48 @@ class RedtubeDriver(AbstractModule):
                                   Returns an empty list if parsing fails or no items are found.
         """
         results = []
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        # Cheap substring check before building any tree
+        if _ITEM_MARKER not in html:
+            logger.warning("%s: No video items found in HTML.", source)
+            return results
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
             
             items = soup.find_all('li', class_='video_li')
             if not items:
-                logger.warning(f"{self.name}: No video items found in HTML.")
+                logger.warning("%s: No video items found in HTML.", source)
                 return results
             
             for item in items:
                 try:
                     link = item.find('a', class_='video_link')
-                    if not link:
+                    if link is None:
                         continue
                     
                     # Extract URL and ID
                     url = link.get('href', '')
-                    match = re.search(r'/(\d+)', url)
-                    video_id = match.group(1) if match else None
+                    video_id = _video_id(url)
                     
-                    # Extract title
-                    title_elem = item.find('a', class_='video_link')
-                    title = title_elem.get('title') if title_elem else 'Untitled Video'
+                    # Extract title (the video link carries it; reuse the node found above)
+                    title = link.get('title') or 'Untitled Video'
                     
                     # Extract thumbnail
                     img = item.find('img')
-                    thumb = img.get('data-src') or img.get('src') if img else None
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('src')
                     
                     # Extract duration
                     duration_elem = item.find('span', class_='duration')
-                    duration = duration_elem.get_text(strip=True) if duration_elem else 'N/A'
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
                     
                     # Validate essential fields
                     if not video_id or not url or not title or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to missing essential fields (id, url, title, or thumb). URL: {url}")
+                        logger.warning("%s: Skipping item due to missing essential fields (id, url, title, or thumb). URL: %s", source, url)
                         continue
                     
                     # Make URLs absolute
@@ -100,7 +127,7 @@ class RedtubeDriver(AbstractModule):
                     thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
                     
                     if not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to failed URL absolute conversion. URL: {url}, Thumb: {thumb}")
+                        logger.warning("%s: Skipping item due to failed URL absolute conversion. URL: %s, Thumb: %s", source, url, thumb)
                         continue
                     
                     results.append({
@@ -109,16 +136,20 @@ class RedtubeDriver(AbstractModule):
                         'url': url,
                         'thumbnail': thumb,
                         'duration': duration,
-                        'source': self.name,
+                        'source': source,
                         'type': 'video'
                     })
+                    if len(results) >= limit:
+                        break
                 
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing video item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing video item: %s", source, e, exc_info=True)
                     continue
         
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
+        finally:
+            self.release_tree(soup)
         
         return results
\ No newline at end of file
@@ -1,16 +1,30 @@
 """SpankBang video source driver."""
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 from urllib.parse import urlencode, quote_plus
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, class_strainer
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://spankbang.com'
 
+_VIDEO_ID_RE = re.compile(r'/([a-z0-9_-]+)/video/')
+
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('div', 'video-item')
+
+# Substring every result container's class attribute contains
+_ITEM_MARKER = 'video-item'
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build a SpankBang search URL for an already-stripped query (memoized)."""
+    return f"{BASE_PLATFORM_URL}/s/{quote_plus(query)}/{page}/"
+
 
 class SpankBangDriver(AbstractModule):
     """Driver for SpankBang platform.
@@ -39,76 +53,88 @@ class SpankBangDriver(AbstractModule):
             str: The constructed URL for the video search on SpankBang.
         """
         page = max(1, page if page else self.first_page)
-        query_encoded = quote_plus(query.strip())
-        return f"{BASE_PLATFORM_URL}/s/{query_encoded}/{page}/"
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a SpankBang search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
                                   represents a video and contains extracted details
                                   like title, URL, thumbnail, duration, etc.
         """
-        logger.debug(f"{self.name} video parsing started.")
         results = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        items = soup.find_all('div', class_='video-item')
-        if not items:
-            logger.debug(f"{self.name} found no video items.")
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        logger.debug("%s video parsing started.", source)
+        # No marker, no results: bail out before the tree builder runs
+        if _ITEM_MARKER not in html:
+            logger.debug("%s found no video items.", source)
             return results
-        
-        for item in items:
-            try:
-                link = item.find('a')
-                if not link:
-                    continue
-                
-                # Extract URL and ID
-                url = link.get('href', '')
-                match = re.search(r'/([a-z0-9_-]+)/video/', url)
-                video_id = match.group(1) if match else None
-                
-                # Extract title
-                title = link.get('title') or 'Untitled Video'
-                
-                # Extract thumbnail
-                img = item.find('img') or item.find('picture').find('img') if item.find('picture') else None
-                thumb = None
-                if img:
-                    thumb = img.get('data-src') or img.get('src')
-                
-                # Extract duration
-                duration_elem = item.find('span', class_='l')
-                duration = duration_elem.get_text(strip=True) if duration_elem else 'N/A'
-                
-                # Validate essential fields
-                if not video_id or not url or not title or not thumb:
-                    continue
-                
-                # Make URLs absolute
-                url = self.make_absolute(url, BASE_PLATFORM_URL)
-                thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+        soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
+        try:
+            items = soup.find_all('div', class_='video-item')
+            if not items:
+                logger.debug("%s found no video items.", source)
+                return results
+            
+            for item in items:
+                try:
+                    link = item.find('a')
+                    if link is None:
+                        continue
+                    
+                    # Extract URL and ID
+                    url = link.get('href', '')
+                    match = _VIDEO_ID_RE.search(url)
+                    video_id = match.group(1) if match else None
+                    
+                    # Extract title
+                    title = link.get('title') or 'Untitled Video'
+                    
+                    # Extract thumbnail (an <img> inside <picture> is found by the same search)
+                    img = item.find('img')
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('src')
+                    
+                    # Extract duration
+                    duration_elem = item.find('span', class_='l')
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
+                    
+                    # Validate essential fields
+                    if not video_id or not url or not title or not thumb:
+                        continue
+                    
+                    # Make URLs absolute
+                    url = self.make_absolute(url, BASE_PLATFORM_URL)
+                    thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+                    
+                    if not url or not thumb:
+                        continue
+                    
+                    results.append({
+                        'id': video_id,
+                        'title': title,
+                        'url': url,
+                        'thumbnail': thumb,
+                        'duration': duration,
+                        'source': source,
+                        'type': 'video'
+                    })
+                    if len(results) >= limit:
+                        break
                 
-                if not url or not thumb:
+                except Exception as e:
+                    logger.error("%s: Error parsing video item: %s", source, e)
                     continue
-                
-                results.append({
-                    'id': video_id,
-                    'title': title,
-                    'url': url,
-                    'thumbnail': thumb,
-                    'duration': duration,
-                    'source': self.name,
-                    'type': 'video'
-                })
-            
-            except Exception as e:
-                logger.error(f"{self.name}: Error parsing video item: {str(e)}")
-                continue
+        finally:
+            self.release_tree(soup)
         
         return results
@@ -1,16 +1,54 @@
 """TNAFlix video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, quote_query, first_text, find_by_class
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.tnaflix.com'
 
+_HREF_RE = re.compile(r'/video')
+_VIDEO_ID_RE = re.compile(r'/video(\d+)')
+
+# Title fallbacks, in priority order, for links without a title attribute
+_TITLE_SELECTORS = (('div', 'title'), ('span', 'title'), ('h2', None), ('a', 'title'))
+
+
+def _is_item_class(css_class: Optional[str]) -> bool:
+    """Match candidate result containers; plain substring checks beat a regex per class token."""
+    return css_class is not None and ('video' in css_class or 'item' in css_class or 'thumb' in css_class)
+
+
+# Tags that may hold the duration / view-count text
+_META_TAGS = ('span', 'div')
+
+
+def _is_duration_class(css_class: Optional[str]) -> bool:
+    """Match duration containers by class name."""
+    return css_class is not None and (
+        'dur' in css_class or 'time' in css_class or 'length' in css_class or 'runtime' in css_class
+    )
+
+
+def _is_views_class(css_class: Optional[str]) -> bool:
+    """Match view-count containers by class name."""
+    return css_class is not None and ('view' in css_class or 'count' in css_class)
+
+
+# Only build candidate containers; the predicate covers both the primary
+# (videoBox/video-box/item) and the fallback selector below
+_VIDEO_STRAINER = SoupStrainer('div', class_=_is_item_class)
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build a TNAFlix search URL for an already-stripped query (memoized)."""
+    return f"{BASE_PLATFORM_URL}/search.php?what={quote_query(query)}&page={page}"
+
 
 class TNAFlixDriver(AbstractModule):
     """Driver for TNAFlix platform.
@@ -39,18 +77,16 @@ class TNAFlixDriver(AbstractModule):
             str: The constructed URL for the video search on TNAFlix.
         """
         page = max(1, page if page else self.first_page)
-        params = {
-            'what': query.strip(),
-            'page': str(page)
-        }
-        logger.debug(f"TNAFlix video URL: query='{query}', page={page}")
-        return f"{BASE_PLATFORM_URL}/search.php?{urlencode(params)}"
+        logger.debug("TNAFlix video URL: query='%s', page=%s", query, page)
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a TNAFlix search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -58,87 +94,82 @@ class TNAFlixDriver(AbstractModule):
                                   like title, URL, thumbnail, duration, views, etc.
         """
         results = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # TNAFlix uses div.videoBox or similar
-        items = soup.find_all('div', class_=['videoBox', 'video-box', 'item'])
-        if not items:
-            # Try alternative selector
-            items = soup.find_all('div', class_=re.compile(r'video|item|thumb'))
-        
-        if not items:
-            return results
-        
-        for item in items:
-            try:
-                link = item.find('a', href=re.compile(r'/video'))
-                if not link:
-                    link = item.find('a')
-                if not link:
-                    continue
-                
-                # Extract URL and ID
-                url = link.get('href', '')
-                match = re.search(r'/video(\d+)', url)
-                video_id = match.group(1) if match else None
-                
-                # Extract title - multiple possible locations
-                title = (
-                    link.get('title') or
-                    item.find('div', class_='title').get_text(strip=True) if item.find('div', class_='title') else None or
-                    item.find('span', class_='title').get_text(strip=True) if item.find('span', class_='title') else None or
-                    item.find('h2').get_text(strip=True) if item.find('h2') else None or
-                    item.find('a', class_='title').get_text(strip=True) if item.find('a', class_='title') else None or
-                    'Untitled Video'
-                )
-                
-                # Clean title
-                title = title.strip()
-                if not title or title.lower() == 'untitled':
-                    title = 'TNAFlix Video'
-                
-                # Extract thumbnail
-                img = item.find('img')
-                thumb = None
-                if img:
-                    thumb = img.get('data-original') or img.get('data-src') or img.get('src')
-                
-                # Extract duration
-                duration_elem = item.find(['span', 'div'], class_=re.compile(r'dur|time|length|runtime'))
-                duration = 'N/A'
-                if duration_elem:
-                    duration = duration_elem.get_text(strip=True)
-                
-                # Extract views
-                views_elem = item.find(['span', 'div'], class_=re.compile(r'view|count'))
-                views = None
-                if views_elem:
-                    views = views_elem.get_text(strip=True)
-                
-                # Validate essential fields
-                if not video_id or not url or not thumb:
-                    continue
-                
-                # Make URLs absolute
-                url = self.make_absolute(url, BASE_PLATFORM_URL)
-                thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
+        try:
+            # TNAFlix uses div.videoBox or similar
+            items = soup.find_all('div', class_=['videoBox', 'video-box', 'item'])
+            if not items:
+                # Try alternative selector
+                items = soup.find_all('div', class_=_is_item_class)
+            
+            if not items:
+                return results
+            
+            for item in items:
+                try:
+                    link = item.find('a', href=_HREF_RE)
+                    if link is None:
+                        link = item.find('a')
+                    if link is None:
+                        continue
+                    
+                    # Extract URL and ID
+                    url = link.get('href', '')
+                    match = _VIDEO_ID_RE.search(url)
+                    video_id = match.group(1) if match else None
+                    
+                    # Extract title - multiple possible locations
+                    # Only walk the item subtree when the link has no title; candidates
+                    # are tried in priority order and empty ones are skipped
+                    title = link.get('title') or first_text(item, _TITLE_SELECTORS) or 'Untitled Video'
+                    
+                    # Clean title
+                    title = title.strip()
+                    if not title or title.lower() == 'untitled':
+                        title = 'TNAFlix Video'
+                    
+                    # Extract thumbnail
+                    img = item.find('img')
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-original') or attrs.get('data-src') or attrs.get('src')
+                    
+                    # Extract duration and views from a single walk of the item
+                    duration_elem, views_elem = find_by_class(item, _META_TAGS, _is_duration_class, _is_views_class)
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
+                    views = views_elem.get_text(strip=True) if views_elem is not None else None
+                    
+                    # Validate essential fields
+                    if not video_id or not url or not thumb:
+                        continue
+                    
+                    # Make URLs absolute
+                    url = self.make_absolute(url, BASE_PLATFORM_URL)
+                    thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+                    
+                    if not url or not thumb:
+                        continue
+                    
+                    results.append({
+                        'id': video_id,
+                        'title': title,
+                        'url': url,
+                        'thumbnail': thumb,
+                        'duration': duration,
+                        'views': views,
+                        'source': source,
+                        'type': 'video'
+                    })
+                    if len(results) >= limit:
+                        break
                 
-                if not url or not thumb:
+                except Exception as e:
+                    logger.error("%s: Error parsing video item: %s", source, e)
                     continue
-                
-                results.append({
-                    'id': video_id,
-                    'title': title,
-                    'url': url,
-                    'thumbnail': thumb,
-                    'duration': duration,
-                    'views': views,
-                    'source': self.name,
-                    'type': 'video'
-                })
-            
-            except Exception as e:
-                logger.error(f"{self.name}: Error parsing video item: {str(e)}")
-                continue
+        finally:
+            self.release_tree(soup)
         
         return results
\ No newline at end of file
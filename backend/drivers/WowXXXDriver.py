@@ -1,16 +1,54 @@
 """WowXXX video source driver."""
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 from urllib.parse import urlencode, quote_plus
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, first_text, find_by_class
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.wow.xxx'
 
+_HREF_RE = re.compile(r'/video/')
+_VIDEO_SLUG_RE = re.compile(r'/video/([a-zA-Z0-9_-]+)')
+_NUMERIC_ID_RE = re.compile(r'/([0-9]+)/')
+
+# Title fallbacks, in priority order, for links without a title attribute
+_TITLE_SELECTORS = (('h2', None), ('h3', None), ('span', 'title'), ('div', 'title'))
+
+
+def _is_item_class(css_class: Optional[str]) -> bool:
+    """Match candidate result containers (div or fallback <article>) by class name."""
+    return css_class is not None and ('video' in css_class or 'item' in css_class)
+
+
+# Only build candidate containers; the predicate covers both the primary
+# div (item/video-item/video-block) and the fallback <article> selector below
+_VIDEO_STRAINER = SoupStrainer(['div', 'article'], class_=_is_item_class)
+
+
+# Tags that may hold the duration / view-count text
+_META_TAGS = ('span', 'div')
+
+
+def _is_duration_class(css_class: Optional[str]) -> bool:
+    """Match duration containers; substring checks are cheaper than a regex per class token."""
+    return css_class is not None and ('dur' in css_class or 'time' in css_class or 'length' in css_class)
+
+
+def _is_views_class(css_class: Optional[str]) -> bool:
+    """Match view-count containers by class name."""
+    return css_class is not None and ('view' in css_class or 'count' in css_class)
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build a WowXXX search URL for an already-stripped query (memoized)."""
+    return f"{BASE_PLATFORM_URL}/search/{quote_plus(query)}?page={page}"
+
 
 class WowXXXDriver(AbstractModule):
     """Driver for Wow.xxx platform.
@@ -40,15 +78,16 @@ class WowXXXDriver(AbstractModule):
             str: The constructed URL for the video search on Wow.xxx.
         """
         page = max(1, page if page else self.first_page)
-        query_encoded = quote_plus(query.strip())
-        logger.debug(f"WowXXX video URL: query='{query}', page={page}")
-        return f"{BASE_PLATFORM_URL}/search/{query_encoded}?page={page}"
+        logger.debug("WowXXX video URL: query='%s', page=%s", query, page)
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of a Wow.xxx search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -57,42 +96,40 @@ class WowXXXDriver(AbstractModule):
                                   Returns an empty list if parsing fails or no items are found.
         """
         results = []
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
             
             # Wow.xxx uses div.item or div.video-item for video items
             items = soup.find_all('div', class_=['item', 'video-item', 'video-block'])
             if not items:
                 # Try alternative selectors
-                items = soup.find_all('article', class_=re.compile(r'video|item'))
+                items = soup.find_all('article', class_=_is_item_class)
             
             if not items:
-                logger.warning(f"{self.name}: No video items found in HTML.")
+                logger.warning("%s: No video items found in HTML.", source)
                 return results
             
             for item in items:
                 try:
-                    link = item.find('a', href=re.compile(r'/video/'))
-                    if not link:
+                    link = item.find('a', href=_HREF_RE)
+                    if link is None:
                         link = item.find('a')
-                    if not link:
+                    if link is None:
                         continue
                     
                     # Extract URL and ID
                     url = link.get('href', '')
                     # Try multiple ID patterns
-                    match = re.search(r'/video/([a-zA-Z0-9_-]+)', url) or re.search(r'/([0-9]+)/', url)
+                    match = _VIDEO_SLUG_RE.search(url) or _NUMERIC_ID_RE.search(url)
                     video_id = match.group(1) if match else None
                     
                     # Extract title - multiple possible locations
-                    title = (
-                        link.get('title') or
-                        item.find('h2').get_text(strip=True) if item.find('h2') else None or
-                        item.find('h3').get_text(strip=True) if item.find('h3') else None or
-                        item.find('span', class_='title').get_text(strip=True) if item.find('span', class_='title') else None or
-                        item.find('div', class_='title').get_text(strip=True) if item.find('div', class_='title') else None or
-                        'Untitled Video'
-                    )
+                    # Only walk the item subtree when the link has no title; candidates
+                    # are tried in priority order and empty ones are skipped
+                    title = link.get('title') or first_text(item, _TITLE_SELECTORS) or 'Untitled Video'
                     
                     # Clean title
                     title = title.strip()
@@ -102,24 +139,18 @@ class WowXXXDriver(AbstractModule):
                     # Extract thumbnail
                     img = item.find('img')
                     thumb = None
-                    if img:
-                        thumb = img.get('data-src') or img.get('data-lazy') or img.get('src')
-                    
-                    # Extract duration
-                    duration_elem = item.find(['span', 'div'], class_=re.compile(r'dur|time|length'))
-                    duration = 'N/A'
-                    if duration_elem:
-                        duration = duration_elem.get_text(strip=True)
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('data-lazy') or attrs.get('src')
                     
-                    # Extract views
-                    views_elem = item.find(['span', 'div'], class_=re.compile(r'view|count'))
-                    views = None
-                    if views_elem:
-                        views = views_elem.get_text(strip=True)
+                    # Extract duration and views from a single walk of the item
+                    duration_elem, views_elem = find_by_class(item, _META_TAGS, _is_duration_class, _is_views_class)
+                    duration = duration_elem.get_text(strip=True) if duration_elem is not None else 'N/A'
+                    views = views_elem.get_text(strip=True) if views_elem is not None else None
                     
                     # Validate essential fields
                     if not video_id or not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to missing essential fields (id, url, or thumb). URL: {url}")
+                        logger.warning("%s: Skipping item due to missing essential fields (id, url, or thumb). URL: %s", source, url)
                         continue
                     
                     # Make URLs absolute
@@ -127,7 +158,7 @@ class WowXXXDriver(AbstractModule):
                     thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
                     
                     if not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to failed URL absolute conversion. URL: {url}, Thumb: {thumb}")
+                        logger.warning("%s: Skipping item due to failed URL absolute conversion. URL: %s, Thumb: %s", source, url, thumb)
                         continue
                     
                     results.append({
@@ -137,16 +168,20 @@ class WowXXXDriver(AbstractModule):
                         'thumbnail': thumb,
                         'duration': duration,
                         'views': views,
-                        'source': self.name,
+                        'source': source,
                         'type': 'video'
                     })
+                    if len(results) >= limit:
+                        break
                 
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing video item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing video item: %s", source, e, exc_info=True)
                     continue
         
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
+        finally:
+            self.release_tree(soup)
         
         return results
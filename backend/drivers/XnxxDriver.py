@@ -1,63 +1,81 @@
-"""Xvideos video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode, quote_plus
+"""XNXX video source driver."""
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
+from urllib.parse import quote
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, class_strainer
 
 logger = logging.getLogger(__name__)
 
-BASE_PLATFORM_URL = 'https://www.xvideos.com'
+BASE_PLATFORM_URL = 'https://www.xnxx.com'
 
+_VIDEO_ID_RE = re.compile(r'/video-([a-z0-9]+)/')
+_DURATION_RE = re.compile(r'(\d+:\d+)')
 
-class XvideosDriver(AbstractModule):
-    """Driver for Xvideos platform.
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('div', 'thumb-block', 'thumb')
 
-    This class handles searching for videos on Xvideos, parsing the search results,
+# Both 'thumb-block' and 'thumb' containers contain this substring
+_ITEM_MARKER = 'thumb'
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build an XNXX search URL for an already-stripped query (memoized).
+
+    The query is a path segment here, so spaces are encoded as %20 and '/' is escaped.
+    """
+    return f"{BASE_PLATFORM_URL}/search/{quote(query, safe='')}/{page}"
+
+
+class XnxxDriver(AbstractModule):
+    """Driver for XNXX platform.
+
+    This class handles searching for videos on XNXX, parsing the search results,
     and extracting relevant video information such as title, URL, thumbnail, and duration.
     It includes error handling to gracefully manage potential issues during parsing.
     """
-    
+
     @property
     def name(self) -> str:
         """Get the name of the platform.
 
         Returns:
-            str: The name of the platform, 'Xvideos'.
+            str: The name of the platform, 'XNXX'.
         """
-        return 'Xvideos'
-    
+        return 'XNXX'
+
     @property
     def first_page(self) -> int:
         """Get the default starting page number for searches.
 
         Returns:
-            int: The default page number, typically 0 for Xvideos.
+            int: The default page number, 0 for XNXX.
         """
-        return 0  # Xvideos starts from page 0
-    
+        return 0  # XNXX starts from page 0
+
     def video_url(self, query: str, page: int) -> str:
-        """Generate the search URL for videos on Xvideos.
+        """Generate the search URL for videos on XNXX.
 
         Args:
             query (str): The search query string.
             page (int): The page number for the search results.
 
         Returns:
-            str: The constructed URL for the video search on Xvideos.
+            str: The constructed URL for the video search on XNXX.
         """
         page = max(0, page if page is not None else self.first_page)
-        query_encoded = quote_plus(query.strip())
-        logger.debug(f"{self.name} video URL: query='{query}', page={page}")
-        return f"{BASE_PLATFORM_URL}/search/{query_encoded}/{page}"
-    
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
-        """Parse the HTML content of an Xvideos search results page to extract video data.
+        return _build_search_url(query.strip(), page)
+
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Parse the HTML content of an XNXX search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
@@ -66,73 +84,85 @@ class XvideosDriver(AbstractModule):
                                   Returns an empty list if parsing fails or no items are found.
         """
         results = []
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        # Empty result pages are rejected by a substring probe instead of a parse
+        if _ITEM_MARKER not in html:
+            logger.warning("%s: No video items found in HTML.", source)
+            return results
+        soup = None
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
+
             items = soup.find_all('div', class_=['thumb-block', 'thumb'])
             if not items:
-                logger.warning(f"{self.name}: No video items found in HTML.")
+                logger.warning("%s: No video items found in HTML.", source)
                 return results
-            
+
             for item in items:
                 try:
                     link = item.find('a')
-                    if not link:
+                    if link is None:
                         continue
-                    
+
                     # Extract URL and ID
                     url = link.get('href', '')
-                    match = re.search(r'/video([0-9]+)/', url)
+                    match = _VIDEO_ID_RE.search(url)
                     video_id = match.group(1) if match else None
-                    
-                    # Extract title
-                    title = (
-                        link.get('title') or
-                        item.find('p', class_='title').get_text(strip=True) if item.find('p', class_='title') else None or
-                        'Untitled Video'
-                    )
-                    
+
+                    # Extract title; untitled items are dropped below
+                    title = link.get('title')
+                    if not title:
+                        title_elem = item.find('p', class_='title')
+                        title = title_elem.get_text(strip=True) if title_elem is not None else None
+
                     # Extract thumbnail
                     img = item.find('img')
-                    thumb = img.get('data-src') or img.get('src') if img else None
-                    
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('src')
+
                     # Extract duration
                     duration_elem = item.find('p', class_='metadata')
                     duration = 'N/A'
-                    if duration_elem:
-                        duration_text = duration_elem.get_text(strip=True)
-                        duration_match = re.search(r'(\d+:\d+)', duration_text)
+                    if duration_elem is not None:
+                        duration_match = _DURATION_RE.search(duration_elem.get_text(strip=True))
                         duration = duration_match.group(1) if duration_match else 'N/A'
-                    
+
                     # Validate essential fields
                     if not video_id or not url or not title or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to missing essential fields (id, url, title, or thumb). URL: {url}")
+                        logger.warning("%s: Skipping item due to missing essential fields (id, url, title, or thumb). URL: %s", source, url)
                         continue
-                    
+
                     # Make URLs absolute
                     url = self.make_absolute(url, BASE_PLATFORM_URL)
                     thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
-                    
+
                     if not url or not thumb:
-                        logger.warning(f"{self.name}: Skipping item due to failed URL absolute conversion. URL: {url}, Thumb: {thumb}")
+                        logger.warning("%s: Skipping item due to failed URL absolute conversion. URL: %s, Thumb: %s", source, url, thumb)
                         continue
-                    
+
                     results.append({
                         'id': video_id,
                         'title': title,
                         'url': url,
                         'thumbnail': thumb,
                         'duration': duration,
-                        'source': self.name,
+                        'source': source,
                         'type': 'video'
                     })
-                
+                    if len(results) >= limit:
+                        break
+
                 except Exception as e:
-                    logger.error(f"{self.name}: Error parsing video item: {str(e)}", exc_info=True)
+                    logger.error("%s: Error parsing video item: %s", source, e, exc_info=True)
                     continue
-        
+
         except Exception as e:
-            logger.error(f"{self.name}: Failed to parse HTML content. Error: {str(e)}", exc_info=True)
+            logger.error("%s: Failed to parse HTML content. Error: %s", source, e, exc_info=True)
             return [] # Return empty list on major parsing failure
-        
-        return results
\ No newline at end of file
+        finally:
+            self.release_tree(soup)
+
+        return results
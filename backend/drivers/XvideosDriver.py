@@ -1,16 +1,30 @@
 """Xvideos video source driver."""
-from typing import Dict, List, Any
-from urllib.parse import urlencode, quote_plus
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
 import logging
 
-from .AbstractModule import AbstractModule
+from .AbstractModule import AbstractModule, MAX_RESULTS_PER_PAGE, quote_query, class_strainer
 
 logger = logging.getLogger(__name__)
 
 BASE_PLATFORM_URL = 'https://www.xvideos.com'
 
+_VIDEO_ID_RE = re.compile(r'/video([0-9]+)/')
+_DURATION_RE = re.compile(r'(\d+:\d+)')
+
+# Only build the result containers; the rest of the page is never turned into Tags
+_VIDEO_STRAINER = class_strainer('div', 'thumb-block', 'thumb')
+
+# Shared substring of the 'thumb-block'/'thumb' container classes
+_ITEM_MARKER = 'thumb'
+
+
+@lru_cache(maxsize=1024)
+def _build_search_url(query: str, page: int) -> str:
+    """Build an Xvideos search URL for an already-stripped query (memoized)."""
+    return f"{BASE_PLATFORM_URL}/?k={quote_query(query)}&p={page}"
+
 
 class XvideosDriver(AbstractModule):
     """Driver for Xvideos platform.
@@ -48,85 +62,95 @@ class XvideosDriver(AbstractModule):
             str: The constructed URL for the video search on Xvideos.
         """
         page = max(0, page if page is not None else self.first_page)
-        params = {
-            'k': query.strip(),
-            'p': str(page)
-        }
-        return f"{BASE_PLATFORM_URL}/?{urlencode(params)}"
+        return _build_search_url(query.strip(), page)
     
-    def video_parser(self, html: str) -> List[Dict[str, Any]]:
+    def video_parser(self, html: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Parse the HTML content of an Xvideos search results page to extract video data.
 
         Args:
             html (str): The HTML content of the search results page.
+            limit (Optional[int]): Maximum number of results to return.
+                Defaults to MAX_RESULTS_PER_PAGE.
 
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary
                                   represents a video and contains extracted details
                                   like title, URL, thumbnail, duration, etc.
         """
-        logger.debug(f"{self.name} video parsing started.")
         results = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        items = soup.find_all('div', class_=['thumb-block', 'thumb'])
-        if not items:
-            logger.debug(f"{self.name} found no video items.")
+        source = self.name
+        limit = limit or MAX_RESULTS_PER_PAGE
+        logger.debug("%s video parsing started.", source)
+        # A plain substring check rules out empty pages before lxml tokenizes them
+        if _ITEM_MARKER not in html:
+            logger.debug("%s found no video items.", source)
             return results
-        
-        for item in items:
-            try:
-                link = item.find('a')
-                if not link:
-                    continue
-                
-                # Extract URL and ID
-                url = link.get('href', '')
-                match = re.search(r'/video([0-9]+)/', url)
-                video_id = match.group(1) if match else None
-                
-                # Extract title
-                title = (
-                    link.get('title') or
-                    item.find('p', class_='title').get_text(strip=True) if item.find('p', class_='title') else None or
-                    'Untitled Video'
-                )
-                
-                # Extract thumbnail
-                img = item.find('img')
-                thumb = img.get('data-src') or img.get('src') if img else None
-                
-                # Extract duration
-                duration_elem = item.find('p', class_='metadata')
-                duration = 'N/A'
-                if duration_elem:
-                    duration_text = duration_elem.get_text(strip=True)
-                    duration_match = re.search(r'(\d+:\d+)', duration_text)
-                    duration = duration_match.group(1) if duration_match else 'N/A'
-                
-                # Validate essential fields
-                if not video_id or not url or not title or not thumb:
-                    continue
-                
-                # Make URLs absolute
-                url = self.make_absolute(url, BASE_PLATFORM_URL)
-                thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+        soup = self.parse_html(html, parse_only=_VIDEO_STRAINER)
+        try:
+            items = soup.find_all('div', class_=['thumb-block', 'thumb'])
+            if not items:
+                logger.debug("%s found no video items.", source)
+                return results
+            
+            for item in items:
+                try:
+                    link = item.find('a')
+                    if link is None:
+                        continue
+                    
+                    # Extract URL and ID
+                    url = link.get('href', '')
+                    match = _VIDEO_ID_RE.search(url)
+                    video_id = match.group(1) if match else None
+                    
+                    # Extract title
+                    title = link.get('title')
+                    if not title:
+                        title_elem = item.find('p', class_='title')
+                        title = (title_elem.get_text(strip=True) if title_elem is not None else None) or 'Untitled Video'
+                    
+                    # Extract thumbnail
+                    img = item.find('img')
+                    thumb = None
+                    if img is not None:
+                        attrs = img.attrs
+                        thumb = attrs.get('data-src') or attrs.get('src')
+                    
+                    # Extract duration
+                    duration_elem = item.find('p', class_='metadata')
+                    duration = 'N/A'
+                    if duration_elem is not None:
+                        duration_text = duration_elem.get_text(strip=True)
+                        duration_match = _DURATION_RE.search(duration_text)
+                        duration = duration_match.group(1) if duration_match else 'N/A'
+                    
+                    # Validate essential fields
+                    if not video_id or not url or not title or not thumb:
+                        continue
+                    
+                    # Make URLs absolute
+                    url = self.make_absolute(url, BASE_PLATFORM_URL)
+                    thumb = self.make_absolute(thumb, BASE_PLATFORM_URL)
+                    
+                    if not url or not thumb:
+                        continue
+                    
+                    results.append({
+                        'id': video_id,
+                        'title': title,
+                        'url': url,
+                        'thumbnail': thumb,
+                        'duration': duration,
+                        'source': source,
+                        'type': 'video'
+                    })
+                    if len(results) >= limit:
+                        break
                 
-                if not url or not thumb:
+                except Exception as e:
+                    logger.error("%s: Error parsing video item: %s", source, e)
                     continue
-                
-                results.append({
-                    'id': video_id,
-                    'title': title,
-                    'url': url,
-                    'thumbnail': thumb,
-                    'duration': duration,
-                    'source': self.name,
-                    'type': 'video'
-                })
-            
-            except Exception as e:
-                logger.error(f"{self.name}: Error parsing video item: {str(e)}")
-                continue
+        finally:
+            self.release_tree(soup)
         
         return results
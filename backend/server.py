@@ -1,19 +1,24 @@
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError, field_validator
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
+from collections import OrderedDict
 import uuid
 from datetime import datetime, timezone
 import httpx
 import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
-import hashlib
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import random # Added for shuffling results
 
 # Import video source drivers
@@ -39,10 +44,14 @@ db = client[os.environ['DB_NAME']]
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("FastAPI app lifespan: startup") # Added log
-    # Startup logic (if any)
+    start_http_client()
+    start_parse_executor()
     yield
     logger.info("FastAPI app lifespan: shutdown") # Added log
     client.close()
+    await stop_http_client()
+    # Joining the worker processes blocks, so keep it off the event loop
+    await asyncio.to_thread(stop_parse_executor)
 
 # Create the main app (ONLY ONCE)
 app = FastAPI(lifespan=lifespan)
@@ -74,12 +83,23 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+# Validates a whole batch of Mongo documents in one pydantic-core call
+status_checks_adapter = TypeAdapter(List[StatusCheck])
+
 class VideoSearchRequest(BaseModel):
     query: str
-    sources: Optional[List[str]] = ["all"]
+    sources: Optional[List[str]] = Field(default=["all"], validate_default=True)
     filters: Optional[Dict[str, Any]] = {}
     page: Optional[int] = 1
     limit: Optional[int] = 20
+    
+    @field_validator("sources")
+    @classmethod
+    def normalize_sources(cls, sources: Optional[List[str]]) -> List[str]:
+        # Expand "all" and sort once here, so cache keys never re-sort the list
+        if not sources or sources == ["all"]:
+            return sorted(API_CONFIGS)
+        return sorted(set(sources))
 
 class Video(BaseModel):
     id: str
@@ -93,6 +113,9 @@ class Video(BaseModel):
     upload_date: Optional[str] = None
     channel: Optional[str] = None
 
+# Validates a source's whole result list in one pydantic-core call
+video_list_adapter = TypeAdapter(List[Video])
+
 class SearchResponse(BaseModel):
     results: List[Video]
     total: int
@@ -105,48 +128,167 @@ class SearchResponse(BaseModel):
 # ============================================
 
 class SearchCache:
-    """Simple in-memory LRU cache for search results"""
-    def __init__(self, max_size=100):
-        self.cache = {}
+    """Simple in-memory segmented-LRU cache of merged search results, with per-entry expiry
+
+    Each entry is the shuffled pool of videos from every searched source; pages
+    are sliced from it, so paging through a query does not search again.
+
+    New pools enter a probationary segment and are promoted to the protected
+    segment on their first hit. A burst of one-off queries only cycles through
+    probation, so it cannot flush the pools that are actually being reused.
+    """
+    def __init__(self, max_size=100, ttl=300, protected_ratio=0.8):
+        # Both segments are ordered least- to most-recently used. Values are
+        # (expires_at, data) with expires_at on the monotonic clock
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
         self.max_size = max_size
-        self.access_times = {}
+        self.protected_size = int(max_size * protected_ratio)
+        self.ttl = ttl
+        # Pools currently being built, so concurrent misses share one search
+        self.inflight: Dict[Tuple[str, Tuple[str, ...], int], asyncio.Task] = {}
     
-    def _make_key(self, query: str, sources: List[str], page: int) -> str:
-        data = f"{query}:{','.join(sorted(sources))}:{page}"
-        return hashlib.md5(data.encode()).hexdigest()
+    def _make_key(self, query: str, sources: List[str], limit: int) -> Tuple[str, Tuple[str, ...], int]:
+        # Tuples hash natively; no string formatting or digest per lookup.
+        # Sources arrive sorted (see VideoSearchRequest.normalize_sources)
+        return query, tuple(sources), limit
     
-    def get(self, query: str, sources: List[str], page: int) -> Optional[Dict]:
-        key = self._make_key(query, sources, page)
-        if key in self.cache:
-            self.access_times[key] = datetime.now()
-            logger.info(f"Cache hit for key: {key}") # Added log
-            return self.cache[key]
-        logger.info(f"Cache miss for key: {key}") # Added log
+    def get(self, query: str, sources: List[str], limit: int) -> Optional[List[Video]]:
+        key = self._make_key(query, sources, limit)
+        segment = self.protected if key in self.protected else self.probation
+        entry = segment.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if time.monotonic() < expires_at:
+                if segment is self.protected:
+                    segment.move_to_end(key)
+                else:
+                    # Second use: promote, demoting the coldest protected entry if full
+                    del segment[key]
+                    self.protected[key] = entry
+                    if len(self.protected) > self.protected_size:
+                        demoted_key, demoted = self.protected.popitem(last=False)
+                        self.probation[demoted_key] = demoted
+                logger.debug("Cache hit for key: %s", key) # Added log
+                return data
+            # Stale listing; drop it and search again
+            del segment[key]
+        logger.debug("Cache miss for key: %s", key) # Added log
         return None
     
-    def set(self, query: str, sources: List[str], page: int, data: Dict):
-        key = self._make_key(query, sources, page)
-        if len(self.cache) >= self.max_size:
-            # Remove oldest accessed item
-            oldest_key = min(self.access_times, key=self.access_times.get)
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
+    def set(self, query: str, sources: List[str], limit: int, data: List[Video]):
+        key = self._make_key(query, sources, limit)
+        logger.debug("Cache set for key: %s", key)
+        entry = (time.monotonic() + self.ttl, data)
+        if key in self.protected:
+            self.protected[key] = entry
+            self.protected.move_to_end(key)
+            return
+        self.probation[key] = entry
+        self.probation.move_to_end(key)
+        if len(self.probation) + len(self.protected) > self.max_size:
+            # Remove least recently used item, from probation whenever possible
+            (self.probation or self.protected).popitem(last=False)
+    
+    async def get_or_build(self, query: str, sources: List[str], limit: int,
+                           build: Callable[[], Awaitable[Tuple[List[Video], bool]]]) -> List[Video]:
+        data = self.get(query, sources, limit)
+        if data is not None:
+            return data
         
-        logger.info(f"Cache set for key: {key}")
-        self.cache[key] = data
-        self.access_times[key] = datetime.now()
+        key = self._make_key(query, sources, limit)
+        task = self.inflight.get(key)
+        if task is None:
+            async def build_and_store() -> List[Video]:
+                pool, complete = await build()
+                # A pool missing a stalled source is served once but not cached,
+                # so the next request retries that source
+                if complete:
+                    self.set(query, sources, limit, pool)
+                return pool
+            
+            task = asyncio.ensure_future(build_and_store())
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        else:
+            logger.debug("Joining in-flight search for key: %s", key)
+        # A disconnecting client must not cancel a build other requests are awaiting
+        return await asyncio.shield(task)
 
 search_cache = SearchCache()
 
+
+# One pooled client for every outbound request, so repeat searches reuse
+# keep-alive connections instead of paying a TCP/TLS handshake per source.
+# It lives for one app lifespan; a closed client cannot be reopened.
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def start_http_client() -> httpx.AsyncClient:
+    """Open the shared outbound HTTP client if it is not open yet."""
+    global http_client
+    if http_client is None:
+        http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return http_client
+
+
+async def stop_http_client():
+    """Close the shared outbound HTTP client and its pooled connections."""
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+# Budget for one source's fetch and parse; a stalled site is dropped from the
+# results instead of holding up the whole search
+SOURCE_TIMEOUT = 15.0
+
+# Dedicated generator for mixing sources' results, kept apart from the
+# module-level random state other code may seed
+shuffle_rng = random.Random()
+
+# HTML parsing is CPU-bound and holds the GIL, so threads only overlap it with I/O;
+# worker processes let several sources' pages parse in parallel. Drivers are
+# stateless and return plain dicts, so the bound parser and its results pickle cheaply.
+# The pool is started in the lifespan hook with 'spawn' workers: forking a process
+# that already runs Motor's and httpx's threads can deadlock the children.
+PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', min(4, os.cpu_count() or 1)))
+parse_executor: Optional[ProcessPoolExecutor] = None
+
+
+def start_parse_executor() -> ProcessPoolExecutor:
+    """Start the parser process pool if it is not running yet."""
+    global parse_executor
+    if parse_executor is None:
+        parse_executor = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return parse_executor
+
+
+def stop_parse_executor():
+    """Shut the parser process pool down, dropping parses that have not started."""
+    global parse_executor
+    if parse_executor is not None:
+        parse_executor.shutdown(wait=True, cancel_futures=True)
+        parse_executor = None
+
 # Initialize drivers dynamically
-API_CONFIGS = {}
+@dataclass(slots=True)
+class SourceConfig:
+    """Runtime state of one video source; ``enabled`` is flipped by the toggle route"""
+    driver: Any
+    enabled: bool = True
+    base_url: Optional[str] = None
+
+API_CONFIGS: Dict[str, SourceConfig] = {}
 for name, driver_class in DRIVER_REGISTRY.items():
     driver = driver_class()
-    API_CONFIGS[name] = {
-        "enabled": True,
-        "driver": driver,
-        "base_url": getattr(driver, 'base_url', None) if hasattr(driver, 'base_url') else None
-    }
+    API_CONFIGS[name] = SourceConfig(driver=driver, base_url=getattr(driver, 'base_url', None))
 
 
 # ============================================
@@ -155,74 +297,106 @@ for name, driver_class in DRIVER_REGISTRY.items():
 
 async def fetch_with_retry(url: str, params: dict, max_retries: int = 3) -> Optional[dict]:
     """Fetch data with exponential backoff retry"""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for attempt in range(max_retries):
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to fetch from {url} after {max_retries} attempts: {str(e)}", exc_info=True) # Added exc_info
-                    return None
-                logger.warning(f"Attempt {attempt+1}/{max_retries} failed for {url}. Retrying in {2**attempt}s...") # Added log
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-        return None
-
-
-async def search_source(source: str, query: str, page: int, limit: int) -> List[Video]:
+    for attempt in range(max_retries):
+        try:
+            response = await http_client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            if attempt == max_retries - 1:
+                logger.error("Failed to fetch from %s after %d attempts: %s", url, max_retries, e, exc_info=True) # Added exc_info
+                return None
+            logger.warning("Attempt %d/%d failed for %s. Retrying in %ds...", attempt + 1, max_retries, url, 2**attempt) # Added log
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+    return None
+
+
+async def search_source(source: str, query: str, page: Optional[int], limit: int) -> List[Video]:
     """Search a specific video source using its driver"""
-    if source not in API_CONFIGS or not API_CONFIGS[source]["enabled"]:
-        logger.debug(f"Source '{source}' is disabled or not found. Skipping.") # Added log
+    config = API_CONFIGS.get(source)
+    if config is None or not config.enabled:
+        logger.debug("Source '%s' is disabled or not found. Skipping.", source) # Added log
         return []
     
-    config = API_CONFIGS[source]
-    driver = config.get("driver")
-    
-    if not driver:
-        logger.warning(f"No driver found for source: {source}")
-        return []
+    driver = config.driver
     
     try:
         # Get the search URL from the driver
         search_url = driver.video_url(query, page)
-        logger.info(f"Searching {source} at URL: {search_url}") # Added log
+        logger.debug("Searching %s at URL: %s", source, search_url) # Added log
         
         # Fetch HTML content
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            try:
-                response = await client.get(search_url, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                response.raise_for_status()
-                html_content = response.text
-                logger.debug(f"Successfully fetched HTML content from {source}.") # Added log
-            except Exception as e:
-                logger.error(f"Failed to fetch HTML from {source} at {search_url}: {str(e)}", exc_info=True) # Added exc_info
-                return []
+        try:
+            response = await http_client.get(search_url, follow_redirects=True, headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+            response.raise_for_status()
+            html_content = response.text
+            logger.debug("Successfully fetched HTML content from %s.", source) # Added log
+        except Exception as e:
+            logger.error("Failed to fetch HTML from %s at %s: %s", source, search_url, e, exc_info=True) # Added exc_info
+            return []
         
-        # Parse results using driver's parser
-        raw_results = driver.video_parser(html_content)
-        logger.debug(f"Parsed {len(raw_results)} raw results from {source}.") # Added log
+        # Parse results using driver's parser;
+        # the parser stops once it has extracted `limit` results
+        loop = asyncio.get_running_loop()
+        # Outside the app lifespan there is no pool and the loop's default thread pool is used
+        raw_results = await loop.run_in_executor(parse_executor, driver.video_parser, html_content, limit)
+        logger.debug("Parsed %d raw results from %s.", len(raw_results), source) # Added log
         
-        # Convert to Video models
-        videos = []
-        for i, result in enumerate(raw_results[:limit]):
-            try:
-                video = Video(**result)
-                videos.append(video)
-            except Exception as e:
-                logger.error(f"Error creating Video model for result #{i+1} from {source} (title: {result.get('title', 'N/A')}): {str(e)}", exc_info=True) # Added exc_info
-                continue
+        # Convert to Video models in one batch; only when some result is malformed
+        # fall back to validating item by item so the good ones are kept
+        rows = raw_results[:limit]
+        try:
+            videos = video_list_adapter.validate_python(rows)
+        except ValidationError:
+            videos = []
+            for i, result in enumerate(rows):
+                try:
+                    video = Video(**result)
+                    videos.append(video)
+                except Exception as e:
+                    logger.error("Error creating Video model for result #%d from %s (title: %s): %s", i + 1, source, result.get('title', 'N/A'), e, exc_info=True) # Added exc_info
+                    continue
         
-        logger.info(f"Successfully processed {len(videos)} videos from {source}.") # Added log
+        logger.debug("Successfully processed %d videos from %s.", len(videos), source) # Added log
         return videos
         
     except Exception as e:
-        logger.error(f"An unexpected error occurred during search for {source}: {str(e)}", exc_info=True) # Added exc_info
+        logger.error("An unexpected error occurred during search for %s: %s", source, e, exc_info=True) # Added exc_info
         return []
 
 
+async def build_result_pool(query: str, sources: List[str], limit: int) -> Tuple[List[Video], bool]:
+    """Search every source concurrently and merge the results into one shuffled pool.
+
+    Returns the pool and whether it is complete, i.e. no source timed out or raised.
+    """
+    logger.info("Initiating concurrent search for query '%s' across sources: %s", query, sources) # Added log
+    search_tasks = [
+        asyncio.wait_for(search_source(source, query, None, limit), timeout=SOURCE_TIMEOUT)
+        for source in sources
+    ]
+    
+    results = await asyncio.gather(*search_tasks, return_exceptions=True)
+    
+    # Flatten and combine results, skipping sources that timed out or failed
+    all_videos = []
+    complete = True
+    for source, video_list in zip(sources, results):
+        if isinstance(video_list, BaseException):
+            logger.warning("Source %s returned no results: %r", source, video_list)
+            complete = False
+            continue
+        all_videos.extend(video_list)
+    
+    # Sort by relevance (you can implement custom scoring)
+    # For now, just shuffle to mix sources. The pool is shuffled once,
+    # so consecutive pages never repeat or skip a video
+    shuffle_rng.shuffle(all_videos)
+    return all_videos, complete
+
+
 # ============================================
 # API Routes
 # ============================================
@@ -244,43 +418,21 @@ async def search_videos(request: VideoSearchRequest):
     - **page**: Page number for pagination
     - **limit**: Results per page
     """
-    logger.info(f"Received search request: query='{request.query}', sources={request.sources}, page={request.page}, limit={request.limit}") # Added log
+    logger.info("Received search request: query='%s', sources=%s, page=%s, limit=%s", request.query, request.sources, request.page, request.limit) # Added log
     try:
-        sources_to_search = request.sources if request.sources and request.sources != ["all"] else list(API_CONFIGS.keys())
-        
-        # Check cache first
-        cached_result = search_cache.get(request.query, sources_to_search, request.page)
-        
-        if cached_result:
-            # Cache hit log is handled within search_cache.get
-            return cached_result
-        
-        logger.info(f"Cache miss for query: {request.query}. Searching active sources: {sources_to_search}") # Added log
-        
-        # Filter enabled sources
-        active_sources = [s for s in sources_to_search if s in API_CONFIGS and API_CONFIGS[s]["enabled"]]
+        # Filter enabled sources; request.sources is already expanded and sorted
+        active_sources = [s for s in request.sources if s in API_CONFIGS and API_CONFIGS[s].enabled]
         
         if not active_sources:
             logger.warning("No active video sources available for search.") # Added log
             raise HTTPException(status_code=400, detail="No active video sources available")
         
-        # Search all sources concurrently
-        logger.info(f"Initiating concurrent search for query '{request.query}' across sources: {active_sources}") # Added log
-        search_tasks = [
-            search_source(source, request.query, request.page, request.limit)
-            for source in active_sources
-        ]
-        
-        results = await asyncio.gather(*search_tasks)
-        
-        # Flatten and combine results
-        all_videos = []
-        for video_list in results:
-            all_videos.extend(video_list)
-        
-        # Sort by relevance (you can implement custom scoring)
-        # For now, just shuffle to mix sources
-        random.shuffle(all_videos)
+        # Check cache first; every page of a query is served from one cached pool,
+        # and identical searches arriving together wait on the same build
+        all_videos = await search_cache.get_or_build(
+            request.query, active_sources, request.limit,
+            lambda: build_result_pool(request.query, active_sources, request.limit)
+        )
         
         # Apply pagination
         start_idx = (request.page - 1) * request.limit
@@ -294,17 +446,16 @@ async def search_videos(request: VideoSearchRequest):
             sources_searched=active_sources
         )
         
-        # Cache the result
-        search_cache.set(request.query, sources_to_search, request.page, response.dict())
-        
-        logger.info(f"Search completed for query='{request.query}'. Found {len(paginated_videos)} results (total available: {len(all_videos)}).") # Modified log
-        return response
+        logger.info("Search completed for query='%s'. Found %d results (total available: %d).", request.query, len(paginated_videos), len(all_videos)) # Modified log
+        # The response is already a validated SearchResponse; serialize it once in
+        # pydantic-core instead of letting FastAPI dump, re-validate and encode it
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except HTTPException as http_exc:
-        logger.error(f"HTTP Exception during search for query='{request.query}': {http_exc.detail}", exc_info=True) # Added log
+        logger.error("HTTP Exception during search for query='%s': %s", request.query, http_exc.detail, exc_info=True) # Added log
         raise http_exc
     except Exception as e:
-        logger.error(f"An unexpected error occurred during search for query='{request.query}': {str(e)}", exc_info=True) # Added exc_info
+        logger.error("An unexpected error occurred during search for query='%s': %s", request.query, e, exc_info=True) # Added exc_info
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
@@ -316,8 +467,8 @@ def get_sources_status(): # Changed from async def to def as it doesn't use awai
         "sources": [
             {
                 "name": name,
-                "enabled": config["enabled"],
-                "driver_name": config["driver"].name if config.get("driver") else name.title()
+                "enabled": config.enabled,
+                "driver_name": config.driver.name
             }
             for name, config in API_CONFIGS.items()
         ]
@@ -332,8 +483,9 @@ async def toggle_source(source_name: str):
         logger.warning(f"Attempted to toggle unknown source: {source_name}") # Added log
         raise HTTPException(status_code=404, detail="Source not found")
     
-    API_CONFIGS[source_name]["enabled"] = not API_CONFIGS[source_name]["enabled"]
-    new_status = API_CONFIGS[source_name]["enabled"]
+    config = API_CONFIGS[source_name]
+    config.enabled = not config.enabled
+    new_status = config.enabled
     logger.info(f"Toggled source '{source_name}'. New status: {'enabled' if new_status else 'disabled'}") # Added log
     return {
         "source": source_name,
@@ -362,9 +514,8 @@ async def create_status_check(input: StatusCheckCreate):
     logger.info(f"Received request to create status check for client: {input.client_name}") # Added log
     status_obj = StatusCheck(**input.model_dump()) # Use model_dump directly for Pydantic v2
     
-    doc = status_obj.model_dump()
-    # Store timestamp as ISO string for easier MongoDB compatibility
-    doc['timestamp'] = doc['timestamp'].isoformat() 
+    # JSON mode stores the timestamp as an ISO string for easier MongoDB compatibility
+    doc = status_obj.model_dump(mode='json')
     
     try:
         await db.status_checks.insert_one(doc)
@@ -388,8 +539,8 @@ async def get_status_checks():
         logger.error(f"Failed to retrieve status checks from MongoDB: {str(e)}", exc_info=True) # Added exc_info
         raise HTTPException(status_code=500, detail="Failed to retrieve status checks")
 
-    # Directly create StatusCheck objects, Pydantic will parse the timestamp string to datetime
-    return [StatusCheck(**check) for check in status_checks_from_db]
+    # Validate the batch in one call; Pydantic parses timestamp strings to datetime
+    return status_checks_adapter.validate_python(status_checks_from_db)
 
 
 # Include the router in the main app (apply to the ONE app instance)
@@ -1,6 +1,4 @@
 import unittest
-from unittest.mock import patch, MagicMock
-from urllib.parse import urljoin
 import re
 import logging
 
@@ -12,116 +10,104 @@ from neonsearch.backend.drivers.WowXXXDriver import WowXXXDriver
 from neonsearch.backend.drivers.XnxxDriver import XnxxDriver
 from neonsearch.backend.drivers.XvideosDriver import XvideosDriver
 
-# Configure logging for tests
-logging.basicConfig(level=logging.ERROR)
+# Keep driver log records out of the test output; the parser tests hit the
+# warning/error paths on purpose. Use assertLogs() where a test needs them.
+_driver_logger = logging.getLogger('neonsearch')
+_driver_logger.addHandler(logging.NullHandler())
+_driver_logger.propagate = False
+
+# Result fields compared by the parser tests
+VIDEO_FIELDS = ('id', 'title', 'url', 'thumbnail', 'duration', 'source', 'type')
+GIF_FIELDS = ('id', 'title', 'url', 'thumbnail', 'preview_video', 'source', 'type')
+VIEWS_FIELDS = VIDEO_FIELDS + ('views',)
+
+
+def pick(result, fields):
+    """Project a result dict onto the compared fields, so one assertDictEqual diffs a whole row."""
+    return {field: result[field] for field in fields}
+
+
+class StubDriver(AbstractModule):
+    """Minimal concrete driver so the AbstractModule helpers can be called for real."""
+
+    @property
+    def name(self):
+        return 'MockPlatform'
+
+    def video_url(self, query, page):
+        return ''
+
+    def video_parser(self, html, limit=None):
+        return []
 
 
 class TestAbstractModule(unittest.TestCase):
     """Tests for the AbstractModule utility methods."""
 
-    def setUp(self):
-        """Set up a mock driver for testing."""
-        self.mock_driver = MagicMock(spec=AbstractModule)
-        self.mock_driver.name = 'MockPlatform'
-        self.mock_driver.first_page = 1
-        self.mock_driver.make_absolute.side_effect = lambda url, base: urljoin(base, url) if url else None
-        self.mock_driver.normalize_duration.side_effect = lambda duration: duration.strip() if duration else 'N/A'
-        self.mock_driver.normalize_views.side_effect = lambda views: views.strip() if views else '0'
+    @classmethod
+    def setUpClass(cls):
+        """Set up one StubDriver instance shared by the read-only tests."""
+        cls.driver = StubDriver()
 
     def test_make_absolute_relative_url(self):
         """Test converting a relative URL to an absolute one."""
         base_url = 'https://example.com/path/'
         relative_url = 'sub/page.html'
         expected_url = 'https://example.com/path/sub/page.html'
-        self.assertEqual(self.mock_driver.make_absolute(relative_url, base_url), expected_url)
+        self.assertEqual(self.driver.make_absolute(relative_url, base_url), expected_url)
 
     def test_make_absolute_absolute_url(self):
         """Test that an absolute URL remains unchanged."""
         base_url = 'https://example.com/path/'
         absolute_url = 'https://another.com/page.html'
-        self.assertEqual(self.mock_driver.make_absolute(absolute_url, base_url), absolute_url)
+        self.assertEqual(self.driver.make_absolute(absolute_url, base_url), absolute_url)
 
     def test_make_absolute_protocol_relative_url(self):
         """Test handling of protocol-relative URLs."""
         base_url = 'https://example.com/path/'
         protocol_relative_url = '//cdn.com/script.js'
         expected_url = 'https://cdn.com/script.js'
-        self.assertEqual(self.mock_driver.make_absolute(protocol_relative_url, base_url), expected_url)
+        self.assertEqual(self.driver.make_absolute(protocol_relative_url, base_url), expected_url)
 
     def test_make_absolute_data_url(self):
         """Test handling of data URLs."""
         base_url = 'https://example.com/path/'
         data_url = 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII='
-        self.assertEqual(self.mock_driver.make_absolute(data_url, base_url), data_url)
+        self.assertEqual(self.driver.make_absolute(data_url, base_url), data_url)
 
     def test_make_absolute_empty_url(self):
         """Test handling of empty or None URLs."""
         base_url = 'https://example.com/path/'
-        self.assertIsNone(self.mock_driver.make_absolute('', base_url))
-        self.assertIsNone(self.mock_driver.make_absolute(None, base_url))
+        self.assertIsNone(self.driver.make_absolute('', base_url))
+        self.assertIsNone(self.driver.make_absolute(None, base_url))
 
     def test_normalize_duration_with_value(self):
         """Test normalizing a duration string."""
         duration = '  1:23  '
-        self.assertEqual(self.mock_driver.normalize_duration(duration), '1:23')
+        self.assertEqual(self.driver.normalize_duration(duration), '1:23')
 
     def test_normalize_duration_empty(self):
         """Test normalizing an empty duration string."""
-        self.assertEqual(self.mock_driver.normalize_duration(''), 'N/A')
-        self.assertEqual(self.mock_driver.normalize_duration(None), 'N/A')
+        self.assertEqual(self.driver.normalize_duration(''), 'N/A')
+        self.assertEqual(self.driver.normalize_duration(None), 'N/A')
 
     def test_normalize_views_with_value(self):
         """Test normalizing a views count string."""
         views = '  1,234,567 '
-        self.assertEqual(self.mock_driver.normalize_views(views), '1,234,567')
+        self.assertEqual(self.driver.normalize_views(views), '1,234,567')
 
     def test_normalize_views_empty(self):
         """Test normalizing an empty views count string."""
-        self.assertEqual(self.mock_driver.normalize_views(''), '0')
-        self.assertEqual(self.mock_driver.normalize_views(None), '0')
+        self.assertEqual(self.driver.normalize_views(''), '0')
+        self.assertEqual(self.driver.normalize_views(None), '0')
 
 if __name__ == '__main__':
     unittest.main()
 
 # --- Tests for EpornerDriver ---
 
-class TestEpornerDriver(unittest.TestCase):
-    """Tests for the EpornerDriver."""
-
-    def setUp(self):
-        """Set up the EpornerDriver instance."""
-        self.driver = EpornerDriver()
-        self.base_url = 'https://www.eporner.com'
-
-    def test_name(self):
-        """Test the name property."""
-        self.assertEqual(self.driver.name, 'Eporner')
-
-    def test_first_page(self):
-        """Test the first_page property."""
-        self.assertEqual(self.driver.first_page, 1)
-
-    def test_video_url_generation(self):
-        """Test the generation of video search URLs."""
-        query = 'test search'
-        page = 2
-        expected_url = 'https://www.eporner.com/search/test%20search/2/'
-        self.assertEqual(self.driver.video_url(query, page), expected_url)
-
-    def test_video_url_generation_default_page(self):
-        """Test URL generation with default page."""
-        query = 'another query'
-        expected_url = 'https://www.eporner.com/search/another%20query/1/'
-        self.assertEqual(self.driver.video_url(query, None), expected_url)
-
-    def test_video_parser_no_items(self):
-        """Test parsing HTML with no video items."""
-        html = '<html><body>No videos found</body></html>'
-        self.assertEqual(self.driver.video_parser(html), [])
-
-    def test_video_parser_with_items(self):
-        """Test parsing HTML with valid video items."""
-        html = """
+# Search results page fixture for test_video_parser_with_items
+EPORNER_VIDEO_HTML = """
         <html><body>
             <div class="mb video-box thumbwook">
                 <a href="/video-12345/" title="Test Video Title" data-src="https://example.com/thumb.jpg">
@@ -141,7 +127,7 @@ class TestEpornerDriver(unittest.TestCase):
             </div>
             <div class="mb video-box thumbwook">
                 <a href="/video-invalid/" title="Invalid Thumb Video">
-                    <img src="nothumb.jpg"> <!-- Invalid thumbnail -->
+                    <img src="nothumb.jpg"> <!-- Relative thumbnail, made absolute -->
                     <div class="title">Invalid Thumb Video</div>
                 </a>
             </div>
@@ -153,45 +139,10 @@ class TestEpornerDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': '12345',
-                'title': 'Test Video Title',
-                'url': 'https://www.eporner.com/video-12345/',
-                'thumbnail': 'https://www.eporner.com/thumb.jpg',
-                'duration': '10:30',
-                'views': '1M views',
-                'source': 'Eporner',
-                'type': 'video'
-            },
-            {
-                'id': '67890',
-                'title': 'Another Video',
-                'url': 'https://www.eporner.com/video-67890/',
-                'thumbnail': 'https://www.eporner.com/thumb2.jpg',
-                'duration': '5:00',
-                'views': '500K views',
-                'source': 'Eporner',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute to ensure it works correctly within the parser
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+EPORNER_VIDEO_MISSING_HTML = """
         <html><body>
             <div class="mb video-box thumbwook">
                 <a href="/video-111/" title="Missing Thumb">
@@ -206,49 +157,71 @@ class TestEpornerDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        # Expecting no results because essential fields are missing or invalid
-        self.assertEqual(self.driver.video_parser(html), [])
 
-    def test_video_parser_with_malformed_html(self):
-        """Test parsing malformed HTML."""
-        html = '<html><body><div class="mb video-box"><a href="/video-abc/">Title</a></div>' # Incomplete HTML
-        # Should not raise an exception and return empty list or partially parsed results if possible
-        # The current implementation might return partial results or empty list depending on BS4's tolerance
-        results = self.driver.video_parser(html)
-        self.assertIsInstance(results, list)
-        # Depending on BS4's parsing, it might find the link and title but fail on other elements.
-        # For this test, we expect it to handle gracefully without crashing.
-        # If it finds the video-abc, it should be added if essential fields are present.
-        # In this case, thumb and duration are missing, so it should be empty.
-        self.assertEqual(len(results), 0)
 
+# Rows expected by test_video_parser_with_items
+EPORNER_VIDEO_EXPECTED = [
+    {
+        'id': '12345',
+        'title': 'Test Video Title',
+        'url': 'https://www.eporner.com/video-12345/',
+        'thumbnail': 'data:image/gif;base64,R0lGODlhAQABAIAAAP///wAAACH5BAEAAAAALAAAAAABAAEAAAICRAEAOw==',
+        'duration': '10:30',
+        'views': '1M views',
+        'source': 'Eporner',
+        'type': 'video'
+    },
+    {
+        'id': '67890',
+        'title': 'Another Video',
+        'url': 'https://www.eporner.com/video-67890/',
+        'thumbnail': 'data:image/gif;base64,R0lGODlhAQABAIAAAP///wAAACH5BAEAAAAALAAAAAABAAEAAAICRAEAOw==',
+        'duration': '5:00',
+        'views': '500K views',
+        'source': 'Eporner',
+        'type': 'video'
+    },
+    {
+        'id': 'invalid',
+        'title': 'Invalid Thumb Video',
+        'url': 'https://www.eporner.com/video-invalid/',
+        'thumbnail': 'https://www.eporner.com/nothumb.jpg',
+        'duration': 'N/A',
+        'views': None,
+        'source': 'Eporner',
+        'type': 'video'
+    }
+]
 
-# --- Tests for PornhubDriver ---
 
-class TestPornhubDriver(unittest.TestCase):
-    """Tests for the PornhubDriver."""
+class TestEpornerDriver(unittest.TestCase):
+    """Tests for the EpornerDriver."""
 
-    def setUp(self):
-        """Set up the PornhubDriver instance."""
-        self.driver = PornhubDriver()
-        self.base_url = 'https://www.pornhub.com'
-        self.gif_domain = 'https://i.pornhub.com'
+    @classmethod
+    def setUpClass(cls):
+        """Set up one EpornerDriver instance shared by the read-only tests."""
+        cls.driver = EpornerDriver()
+        cls.base_url = 'https://www.eporner.com'
 
     def test_name(self):
         """Test the name property."""
-        self.assertEqual(self.driver.name, 'Pornhub')
+        self.assertEqual(self.driver.name, 'Eporner')
+
+    def test_first_page(self):
+        """Test the first_page property."""
+        self.assertEqual(self.driver.first_page, 1)
 
     def test_video_url_generation(self):
         """Test the generation of video search URLs."""
         query = 'test search'
         page = 2
-        expected_url = 'https://www.pornhub.com/video/search?search=test+search&page=2'
+        expected_url = 'https://www.eporner.com/search/test+search/2/'
         self.assertEqual(self.driver.video_url(query, page), expected_url)
 
     def test_video_url_generation_default_page(self):
         """Test URL generation with default page."""
         query = 'another query'
-        expected_url = 'https://www.pornhub.com/video/search?search=another%20query&page=1'
+        expected_url = 'https://www.eporner.com/search/another+query/1/'
         self.assertEqual(self.driver.video_url(query, None), expected_url)
 
     def test_video_parser_no_items(self):
@@ -258,7 +231,39 @@ class TestPornhubDriver(unittest.TestCase):
 
     def test_video_parser_with_items(self):
         """Test parsing HTML with valid video items."""
-        html = """
+        html = EPORNER_VIDEO_HTML
+        expected_results = EPORNER_VIDEO_EXPECTED
+        
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIEWS_FIELDS), pick(expected, VIEWS_FIELDS))
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = EPORNER_VIDEO_MISSING_HTML
+        # Expecting no results because essential fields are missing or invalid
+        self.assertEqual(self.driver.video_parser(html), [])
+
+    def test_video_parser_with_malformed_html(self):
+        """Test parsing malformed HTML."""
+        html = '<html><body><div class="mb video-box"><a href="/video-abc/">Title</a></div>' # Incomplete HTML
+        # Should not raise an exception and return empty list or partially parsed results if possible
+        # The current implementation might return partial results or empty list depending on BS4's tolerance
+        results = self.driver.video_parser(html)
+        self.assertIsInstance(results, list)
+        # Depending on BS4's parsing, it might find the link and title but fail on other elements.
+        # For this test, we expect it to handle gracefully without crashing.
+        # If it finds the video-abc, it should be added if essential fields are present.
+        # In this case, thumb and duration are missing, so it should be empty.
+        self.assertEqual(len(results), 0)
+
+
+# --- Tests for PornhubDriver ---
+
+# Search results page fixture for test_video_parser_with_items
+PORNHUB_VIDEO_HTML = """
         <html><body>
             <div class="phimage">
                 <a href="/viewkey=12345abc" title="Test Video Title">
@@ -282,73 +287,9 @@ class TestPornhubDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': '12345abc',
-                'title': 'Test Video Title',
-                'url': 'https://www.pornhub.com/viewkey=12345abc',
-                'thumbnail': 'https://i.pornhub.com/thumbs/123.jpg',
-                'duration': '10:30',
-                'source': 'Pornhub',
-                'type': 'video'
-            },
-            {
-                'id': '67890def',
-                'title': 'Another Video',
-                'url': 'https://www.pornhub.com/viewkey=67890def',
-                'thumbnail': 'https://i.pornhub.com/thumbs/456.jpg',
-                'duration': '5:00',
-                'source': 'Pornhub',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute to ensure it works correctly within the parser
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
-
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
-        <html><body>
-            <div class="phimage">
-                <a href="/viewkey=111" title="Missing Thumb">
-                    <span class="title">Missing Thumb</span>
-                    <var class="duration">1:00</var>
-                </a>
-            </div>
-            <div class="phimage"> <!-- Missing title, thumb, duration -->
-                <a href="/viewkey=222"></a>
-            </div>
-        </body></html>
-        """
-        # Expecting no results because essential fields are missing or invalid
-        self.assertEqual(self.driver.video_parser(html), [])
-
-    def test_gif_url_generation(self):
-        """Test the generation of GIF search URLs."""
-        query = 'test gif'
-        page = 3
-        expected_url = 'https://www.pornhub.com/gifs/search?search=test+gif&page=3'
-        self.assertEqual(self.driver.gif_url(query, page), expected_url)
-
-    def test_gif_parser_no_items(self):
-        """Test parsing HTML with no GIF items."""
-        html = '<html><body>No GIFs found</body></html>'
-        self.assertEqual(self.driver.gif_parser(html), [])
 
-    def test_gif_parser_with_items(self):
-        """Test parsing HTML with valid GIF items."""
-        html = """
+# Search results page fixture for test_gif_parser_with_items
+PORNHUB_GIF_HTML = """
         <html><body>
             <div class="gifImageBlock img-container" data-id="gif123">
                 <a href="/gifs/123/gif-title/">
@@ -360,7 +301,7 @@ class TestPornhubDriver(unittest.TestCase):
                     <img src="https://i.pornhub.com/gifs/456.gif" alt="Another GIF">
                 </a>
             </div>
-            <div class="gifImageBlock img-container"> <!-- Missing ID -->
+            <div class="gifImageBlock img-container"> <!-- No data-id; id comes from the href -->
                 <a href="/gifs/789/no-id/">
                     <img data-src="https://i.pornhub.com/gifs/789.gif" alt="No ID GIF">
                 </a>
@@ -372,43 +313,26 @@ class TestPornhubDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': 'gif123',
-                'title': 'Test GIF Title',
-                'url': 'https://www.pornhub.com/gifs/123/gif-title/',
-                'thumbnail': 'https://i.pornhub.com/gifs/123.gif',
-                'preview_video': 'https://i.pornhub.com/gifs/123.gif',
-                'source': 'Pornhub',
-                'type': 'gif'
-            },
-            {
-                'id': 'gif456',
-                'title': 'Another GIF',
-                'url': 'https://www.pornhub.com/gifs/456/another-gif/',
-                'thumbnail': 'https://i.pornhub.com/gifs/456.gif',
-                'preview_video': 'https://i.pornhub.com/gifs/456.gif',
-                'source': 'Pornhub',
-                'type': 'gif'
-            }
-        ]
-        
-        # Mocking make_absolute
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.gif_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['preview_video'], expected_results[i]['preview_video'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_gif_parser_with_missing_elements(self):
-        """Test parsing HTML where some GIF elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+PORNHUB_VIDEO_MISSING_HTML = """
+        <html><body>
+            <div class="phimage">
+                <a href="/viewkey=111" title="Missing Thumb">
+                    <span class="title">Missing Thumb</span>
+                    <var class="duration">1:00</var>
+                </a>
+            </div>
+            <div class="phimage"> <!-- Missing title, thumb, duration -->
+                <a href="/viewkey=222"></a>
+            </div>
+        </body></html>
+        """
+
+
+# Results page fixture with incomplete items for test_gif_parser_with_missing_elements
+PORNHUB_GIF_MISSING_HTML = """
         <html><body>
             <div class="gifImageBlock img-container" data-id="gif111">
                 <a href="/gifs/111/missing-thumb/">
@@ -420,35 +344,88 @@ class TestPornhubDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        # Expecting no results because essential fields are missing or invalid
-        self.assertEqual(self.driver.gif_parser(html), [])
 
 
-# --- Tests for RedtubeDriver ---
+# Rows expected by test_video_parser_with_items
+PORNHUB_VIDEO_EXPECTED = [
+    {
+        'id': '12345abc',
+        'title': 'Test Video Title',
+        'url': 'https://www.pornhub.com/viewkey=12345abc',
+        'thumbnail': 'https://i.pornhub.com/thumbs/123.jpg',
+        'duration': '10:30',
+        'source': 'Pornhub',
+        'type': 'video'
+    },
+    {
+        'id': '67890def',
+        'title': 'Another Video',
+        'url': 'https://www.pornhub.com/viewkey=67890def',
+        'thumbnail': 'https://i.pornhub.com/thumbs/456.jpg',
+        'duration': '5:00',
+        'source': 'Pornhub',
+        'type': 'video'
+    }
+]
+
+
+# Rows expected by test_gif_parser_with_items
+PORNHUB_GIF_EXPECTED = [
+    {
+        'id': 'gif123',
+        'title': 'Test GIF Title',
+        'url': 'https://www.pornhub.com/gifs/123/gif-title/',
+        'thumbnail': 'https://i.pornhub.com/gifs/123.gif',
+        'preview_video': 'https://i.pornhub.com/gifs/123.gif',
+        'source': 'Pornhub',
+        'type': 'gif'
+    },
+    {
+        'id': 'gif456',
+        'title': 'Another GIF',
+        'url': 'https://www.pornhub.com/gifs/456/another-gif/',
+        'thumbnail': 'https://i.pornhub.com/gifs/456.gif',
+        'preview_video': 'https://i.pornhub.com/gifs/456.gif',
+        'source': 'Pornhub',
+        'type': 'gif'
+    },
+    {
+        'id': '789',
+        'title': 'No ID GIF',
+        'url': 'https://www.pornhub.com/gifs/789/no-id/',
+        'thumbnail': 'https://i.pornhub.com/gifs/789.gif',
+        'preview_video': 'https://i.pornhub.com/gifs/789.gif',
+        'source': 'Pornhub',
+        'type': 'gif'
+    }
+]
 
-class TestRedtubeDriver(unittest.TestCase):
-    """Tests for the RedtubeDriver."""
 
-    def setUp(self):
-        """Set up the RedtubeDriver instance."""
-        self.driver = RedtubeDriver()
-        self.base_url = 'https://www.redtube.com'
+class TestPornhubDriver(unittest.TestCase):
+    """Tests for the PornhubDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one PornhubDriver instance shared by the read-only tests."""
+        cls.driver = PornhubDriver()
+        cls.base_url = 'https://www.pornhub.com'
+        cls.gif_domain = 'https://i.pornhub.com'
 
     def test_name(self):
         """Test the name property."""
-        self.assertEqual(self.driver.name, 'Redtube')
+        self.assertEqual(self.driver.name, 'Pornhub')
 
     def test_video_url_generation(self):
         """Test the generation of video search URLs."""
         query = 'test search'
         page = 2
-        expected_url = 'https://www.redtube.com/?search=test+search&page=2'
+        expected_url = 'https://www.pornhub.com/video/search?search=test+search&page=2'
         self.assertEqual(self.driver.video_url(query, page), expected_url)
 
     def test_video_url_generation_default_page(self):
         """Test URL generation with default page."""
         query = 'another query'
-        expected_url = 'https://www.redtube.com/?search=another%20query&page=1'
+        expected_url = 'https://www.pornhub.com/video/search?search=another+query&page=1'
         self.assertEqual(self.driver.video_url(query, None), expected_url)
 
     def test_video_parser_no_items(self):
@@ -458,17 +435,65 @@ class TestRedtubeDriver(unittest.TestCase):
 
     def test_video_parser_with_items(self):
         """Test parsing HTML with valid video items."""
-        html = """
+        html = PORNHUB_VIDEO_HTML
+        expected_results = PORNHUB_VIDEO_EXPECTED
+        
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIDEO_FIELDS), pick(expected, VIDEO_FIELDS))
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = PORNHUB_VIDEO_MISSING_HTML
+        # Expecting no results because essential fields are missing or invalid
+        self.assertEqual(self.driver.video_parser(html), [])
+
+    def test_gif_url_generation(self):
+        """Test the generation of GIF search URLs."""
+        query = 'test gif'
+        page = 3
+        expected_url = 'https://www.pornhub.com/gifs/search?search=test+gif&page=3'
+        self.assertEqual(self.driver.gif_url(query, page), expected_url)
+
+    def test_gif_parser_no_items(self):
+        """Test parsing HTML with no GIF items."""
+        html = '<html><body>No GIFs found</body></html>'
+        self.assertEqual(self.driver.gif_parser(html), [])
+
+    def test_gif_parser_with_items(self):
+        """Test parsing HTML with valid GIF items."""
+        html = PORNHUB_GIF_HTML
+        expected_results = PORNHUB_GIF_EXPECTED
+        
+        actual_results = self.driver.gif_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, GIF_FIELDS), pick(expected, GIF_FIELDS))
+
+    def test_gif_parser_with_missing_elements(self):
+        """Test parsing HTML where some GIF elements are missing."""
+        html = PORNHUB_GIF_MISSING_HTML
+        # Expecting no results because essential fields are missing or invalid
+        self.assertEqual(self.driver.gif_parser(html), [])
+
+
+# --- Tests for RedtubeDriver ---
+
+# Search results page fixture for test_video_parser_with_items
+REDTUBE_VIDEO_HTML = """
         <html><body>
             <li class="video_li">
-                <a href="/video123/" class="video_link" title="Test Video Title">
+                <a href="/123" class="video_link" title="Test Video Title">
                     <img data-src="https://www.redtube.com/thumbs/123.jpg">
                     <span class="title">Test Video Title</span>
                     <span class="duration">10:30</span>
                 </a>
             </li>
             <li class="video_li">
-                <a href="/video456/" class="video_link" title="Another Video">
+                <a href="/456" class="video_link" title="Another Video">
                     <img src="https://www.redtube.com/thumbs/456.jpg">
                     <span class="title">Another Video</span>
                     <span class="duration">5:00</span>
@@ -483,106 +508,96 @@ class TestRedtubeDriver(unittest.TestCase):
             </li>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': '123',
-                'title': 'Test Video Title',
-                'url': 'https://www.redtube.com/video123/',
-                'thumbnail': 'https://www.redtube.com/thumbs/123.jpg',
-                'duration': '10:30',
-                'source': 'Redtube',
-                'type': 'video'
-            },
-            {
-                'id': '456',
-                'title': 'Another Video',
-                'url': 'https://www.redtube.com/video456/',
-                'thumbnail': 'https://www.redtube.com/thumbs/456.jpg',
-                'duration': '5:00',
-                'source': 'Redtube',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+REDTUBE_VIDEO_MISSING_HTML = """
         <html><body>
             <li class="video_li">
-                <a href="/video/111/" title="Missing Duration">
+                <a href="/111" class="video_link" title="Missing Duration">
                     <img data-src="https://www.redtube.com/thumbs/111.jpg">
                     <span class="title">Missing Duration</span>
                 </a>
             </li>
             <li class="video_li"> <!-- Missing title, duration -->
-                <a href="/video/222/">
+                <a href="/222" class="video_link">
                     <img data-src="https://www.redtube.com/thumbs/222.jpg">
                 </a>
             </li>
         </body></html>
         """
-        # Expecting results, but duration might be 'N/A'
-        expected_results = [
-            {
-                'id': '111',
-                'title': 'Missing Duration',
-                'url': 'https://www.redtube.com/video/111/',
-                'thumbnail': 'https://www.redtube.com/thumbs/111.jpg',
-                'duration': 'N/A',
-                'source': 'Redtube',
-                'type': 'video'
-            }
-        ]
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            self.assertEqual(actual_results[0]['id'], expected_results[0]['id'])
-            self.assertEqual(actual_results[0]['title'], expected_results[0]['title'])
-            self.assertEqual(actual_results[0]['url'], expected_results[0]['url'])
-            self.assertEqual(actual_results[0]['thumbnail'], expected_results[0]['thumbnail'])
-            self.assertEqual(actual_results[0]['duration'], expected_results[0]['duration'])
-            self.assertEqual(actual_results[0]['source'], expected_results[0]['source'])
-            self.assertEqual(actual_results[0]['type'], expected_results[0]['type'])
 
 
-# --- Tests for WowXXXDriver ---
+# Rows expected by test_video_parser_with_items
+REDTUBE_VIDEO_EXPECTED = [
+    {
+        'id': '123',
+        'title': 'Test Video Title',
+        'url': 'https://www.redtube.com/123',
+        'thumbnail': 'https://www.redtube.com/thumbs/123.jpg',
+        'duration': '10:30',
+        'source': 'Redtube',
+        'type': 'video'
+    },
+    {
+        'id': '456',
+        'title': 'Another Video',
+        'url': 'https://www.redtube.com/456',
+        'thumbnail': 'https://www.redtube.com/thumbs/456.jpg',
+        'duration': '5:00',
+        'source': 'Redtube',
+        'type': 'video'
+    }
+]
+
+
+# Rows expected by test_video_parser_with_missing_elements
+REDTUBE_VIDEO_MISSING_EXPECTED = [
+    {
+        'id': '111',
+        'title': 'Missing Duration',
+        'url': 'https://www.redtube.com/111',
+        'thumbnail': 'https://www.redtube.com/thumbs/111.jpg',
+        'duration': 'N/A',
+        'source': 'Redtube',
+        'type': 'video'
+    },
+    {
+        'id': '222',
+        'title': 'Untitled Video',
+        'url': 'https://www.redtube.com/222',
+        'thumbnail': 'https://www.redtube.com/thumbs/222.jpg',
+        'duration': 'N/A',
+        'source': 'Redtube',
+        'type': 'video'
+    }
+]
 
-class TestWowXXXDriver(unittest.TestCase):
-    """Tests for the WowXXXDriver."""
 
-    def setUp(self):
-        """Set up the WowXXXDriver instance."""
-        self.driver = WowXXXDriver()
-        self.base_url = 'https://www.wow.xxx'
+class TestRedtubeDriver(unittest.TestCase):
+    """Tests for the RedtubeDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one RedtubeDriver instance shared by the read-only tests."""
+        cls.driver = RedtubeDriver()
+        cls.base_url = 'https://www.redtube.com'
 
     def test_name(self):
         """Test the name property."""
-        self.assertEqual(self.driver.name, 'Wow.xxx')
+        self.assertEqual(self.driver.name, 'Redtube')
 
     def test_video_url_generation(self):
         """Test the generation of video search URLs."""
         query = 'test search'
         page = 2
-        expected_url = 'https://www.wow.xxx/search/test%20search?page=2'
+        expected_url = 'https://www.redtube.com/?search=test+search&page=2'
         self.assertEqual(self.driver.video_url(query, page), expected_url)
 
     def test_video_url_generation_default_page(self):
         """Test URL generation with default page."""
         query = 'another query'
-        expected_url = 'https://www.wow.xxx/search/another%20query?page=1'
+        expected_url = 'https://www.redtube.com/?search=another+query&page=1'
         self.assertEqual(self.driver.video_url(query, None), expected_url)
 
     def test_video_parser_no_items(self):
@@ -592,7 +607,50 @@ class TestWowXXXDriver(unittest.TestCase):
 
     def test_video_parser_with_items(self):
         """Test parsing HTML with valid video items."""
+        html = REDTUBE_VIDEO_HTML
+        expected_results = REDTUBE_VIDEO_EXPECTED
+        
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIDEO_FIELDS), pick(expected, VIDEO_FIELDS))
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = REDTUBE_VIDEO_MISSING_HTML
+        # Expecting results, but duration might be 'N/A'
+        expected_results = REDTUBE_VIDEO_MISSING_EXPECTED
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIDEO_FIELDS), pick(expected, VIDEO_FIELDS))
+
+    def test_video_parser_id_with_query_string(self):
+        """Test that ids are extracted from hrefs carrying a query string or fragment."""
         html = """
+        <html><body>
+            <li class="video_li">
+                <a class="video_link" href="/12345?pkey=abc" title="Query Video">
+                    <img data-src="https://www.redtube.com/thumbs/12345.jpg">
+                </a>
+            </li>
+            <li class="video_li">
+                <a class="video_link" href="/67890#comments" title="Fragment Video">
+                    <img data-src="https://www.redtube.com/thumbs/67890.jpg">
+                </a>
+            </li>
+        </body></html>
+        """
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual([res['id'] for res in actual_results], ['12345', '67890'])
+
+
+# --- Tests for WowXXXDriver ---
+
+# Search results page fixture for test_video_parser_with_items
+WOWXXX_VIDEO_HTML = """
         <html><body>
             <div class="item video-item video-block">
                 <a href="/video/12345abc/" title="Test Video Title">
@@ -616,53 +674,17 @@ class TestWowXXXDriver(unittest.TestCase):
                     <div class="title">Invalid ID Video</div>
                 </a>
             </div>
-            <div class="item video-item video-block"> <!-- Missing title -->
+            <div class="item video-item video-block"> <!-- Missing title, kept as untitled -->
                 <a href="/video/no-title/">
                     <img data-src="https://www.wow.xxx/thumbs/no-title.jpg">
                 </a>
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': '12345abc',
-                'title': 'Test Video Title',
-                'url': 'https://www.wow.xxx/video/12345abc/',
-                'thumbnail': 'https://www.wow.xxx/thumbs/123.jpg',
-                'duration': '10:30',
-                'views': '1M views',
-                'source': 'Wow.xxx',
-                'type': 'video'
-            },
-            {
-                'id': '67890def',
-                'title': 'Another Video',
-                'url': 'https://www.wow.xxx/video/67890def/',
-                'thumbnail': 'https://www.wow.xxx/thumbs/456.jpg',
-                'duration': '5:00',
-                'views': '500K views',
-                'source': 'Wow.xxx',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['views'], expected_results[i]['views'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+WOWXXX_VIDEO_MISSING_HTML = """
         <html><body>
             <div class="item video-item video-block">
                 <a href="/video/111/" title="Missing Duration">
@@ -677,61 +699,92 @@ class TestWowXXXDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        # Expecting results, but duration might be 'N/A'
-        expected_results = [
-            {
-                'id': '111',
-                'title': 'Missing Duration',
-                'url': 'https://www.wow.xxx/video/111/',
-                'thumbnail': 'https://www.wow.xxx/thumbs/111.jpg',
-                'duration': 'N/A',
-                'views': None, # Views are optional and might be None if not found
-                'source': 'Wow.xxx',
-                'type': 'video'
-            }
-        ]
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            self.assertEqual(actual_results[0]['id'], expected_results[0]['id'])
-            self.assertEqual(actual_results[0]['title'], expected_results[0]['title'])
-            self.assertEqual(actual_results[0]['url'], expected_results[0]['url'])
-            self.assertEqual(actual_results[0]['thumbnail'], expected_results[0]['thumbnail'])
-            self.assertEqual(actual_results[0]['duration'], expected_results[0]['duration'])
-            self.assertEqual(actual_results[0]['views'], expected_results[0]['views'])
-            self.assertEqual(actual_results[0]['source'], expected_results[0]['source'])
-            self.assertEqual(actual_results[0]['type'], expected_results[0]['type'])
 
 
-# --- Tests for XnxxDriver ---
+# Rows expected by test_video_parser_with_items
+WOWXXX_VIDEO_EXPECTED = [
+    {
+        'id': '12345abc',
+        'title': 'Test Video Title',
+        'url': 'https://www.wow.xxx/video/12345abc/',
+        'thumbnail': 'https://www.wow.xxx/thumbs/123.jpg',
+        'duration': '10:30',
+        'views': '1M views',
+        'source': 'Wow.xxx',
+        'type': 'video'
+    },
+    {
+        'id': '67890def',
+        'title': 'Another Video',
+        'url': 'https://www.wow.xxx/video/67890def/',
+        'thumbnail': 'https://www.wow.xxx/thumbs/456.jpg',
+        'duration': '5:00',
+        'views': '500K views',
+        'source': 'Wow.xxx',
+        'type': 'video'
+    },
+    {
+        'id': 'no-title',
+        'title': 'Untitled Video',
+        'url': 'https://www.wow.xxx/video/no-title/',
+        'thumbnail': 'https://www.wow.xxx/thumbs/no-title.jpg',
+        'duration': 'N/A',
+        'views': None,
+        'source': 'Wow.xxx',
+        'type': 'video'
+    }
+]
+
+
+# Rows expected by test_video_parser_with_missing_elements
+WOWXXX_VIDEO_MISSING_EXPECTED = [
+    {
+        'id': '111',
+        'title': 'Missing Duration',
+        'url': 'https://www.wow.xxx/video/111/',
+        'thumbnail': 'https://www.wow.xxx/thumbs/111.jpg',
+        'duration': 'N/A',
+        'views': None, # Views are optional and might be None if not found
+        'source': 'Wow.xxx',
+        'type': 'video'
+    },
+    {
+        'id': '222',
+        'title': 'Untitled Video',
+        'url': 'https://www.wow.xxx/video/222/',
+        'thumbnail': 'https://www.wow.xxx/thumbs/222.jpg',
+        'duration': 'N/A',
+        'views': None,
+        'source': 'Wow.xxx',
+        'type': 'video'
+    }
+]
 
-class TestXnxxDriver(unittest.TestCase):
-    """Tests for the XnxxDriver."""
 
-    def setUp(self):
-        """Set up the XnxxDriver instance."""
-        self.driver = XnxxDriver()
-        self.base_url = 'https://www.xnxx.com'
+class TestWowXXXDriver(unittest.TestCase):
+    """Tests for the WowXXXDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one WowXXXDriver instance shared by the read-only tests."""
+        cls.driver = WowXXXDriver()
+        cls.base_url = 'https://www.wow.xxx'
 
     def test_name(self):
         """Test the name property."""
-        self.assertEqual(self.driver.name, 'XNXX')
-
-    def test_first_page(self):
-        """Test the first_page property."""
-        self.assertEqual(self.driver.first_page, 0)
+        self.assertEqual(self.driver.name, 'Wow.xxx')
 
     def test_video_url_generation(self):
         """Test the generation of video search URLs."""
         query = 'test search'
         page = 2
-        expected_url = 'https://www.xnxx.com/search/test%20search/2'
+        expected_url = 'https://www.wow.xxx/search/test+search?page=2'
         self.assertEqual(self.driver.video_url(query, page), expected_url)
 
     def test_video_url_generation_default_page(self):
         """Test URL generation with default page."""
         query = 'another query'
-        expected_url = 'https://www.xnxx.com/search/another%20query/0'
+        expected_url = 'https://www.wow.xxx/search/another+query?page=1'
         self.assertEqual(self.driver.video_url(query, None), expected_url)
 
     def test_video_parser_no_items(self):
@@ -741,7 +794,74 @@ class TestXnxxDriver(unittest.TestCase):
 
     def test_video_parser_with_items(self):
         """Test parsing HTML with valid video items."""
+        html = WOWXXX_VIDEO_HTML
+        expected_results = WOWXXX_VIDEO_EXPECTED
+        
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIEWS_FIELDS), pick(expected, VIEWS_FIELDS))
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = WOWXXX_VIDEO_MISSING_HTML
+        # Expecting results, but duration might be 'N/A'
+        expected_results = WOWXXX_VIDEO_MISSING_EXPECTED
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIEWS_FIELDS), pick(expected, VIEWS_FIELDS))
+
+    def test_video_parser_title_fallback_order(self):
+        """Test that the link title wins and fallbacks are tried in priority order."""
+        html = """
+        <html><body>
+            <div class="item video-item video-block">
+                <a href="/video/333/" title="Link Title">
+                    <img data-src="https://www.wow.xxx/thumbs/333.jpg">
+                    <span class="title">Span Title</span>
+                </a>
+            </div>
+            <div class="item video-item video-block">
+                <a href="/video/444/">
+                    <img data-src="https://www.wow.xxx/thumbs/444.jpg">
+                    <div class="title">Div Title</div>
+                    <h3>Heading Title</h3>
+                </a>
+            </div>
+        </body></html>
+        """
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual([res['title'] for res in actual_results], ['Link Title', 'Heading Title'])
+
+    def test_video_parser_title_fallback_classed_heading(self):
+        """Test that the h2/h3 title fallbacks also match headings that carry a class."""
         html = """
+        <html><body>
+            <div class="item video-item video-block">
+                <a href="/video/555/">
+                    <img data-src="https://www.wow.xxx/thumbs/555.jpg">
+                    <h2 class="vtitle">Classed H2 Title</h2>
+                </a>
+            </div>
+            <div class="item video-item video-block">
+                <a href="/video/666/">
+                    <img data-src="https://www.wow.xxx/thumbs/666.jpg">
+                    <h3 class="thumb-title">Classed H3 Title</h3>
+                </a>
+            </div>
+        </body></html>
+        """
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual([res['title'] for res in actual_results], ['Classed H2 Title', 'Classed H3 Title'])
+
+
+# --- Tests for XnxxDriver ---
+
+# Search results page fixture for test_video_parser_with_items
+XNXX_VIDEO_HTML = """
         <html><body>
             <div class="thumb">
                 <a href="/video-abcde/" title="Test Video Title">
@@ -755,50 +875,17 @@ class TestXnxxDriver(unittest.TestCase):
                     <p class="metadata">5:00</p>
                 </a>
             </div>
-            <div class="thumb"> <!-- Missing ID -->
+            <div class="thumb"> <!-- Slug id, no duration -->
                 <a href="/video-invalid/" title="Invalid ID Video">
                     <img data-src="https://www.xnxx.com/thumbs/invalid.jpg">
                 </a>
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': 'abcde',
-                'title': 'Test Video Title',
-                'url': 'https://www.xnxx.com/video-abcde/',
-                'thumbnail': 'https://www.xnxx.com/thumbs/abcde.jpg',
-                'duration': '10:30',
-                'source': 'XNXX',
-                'type': 'video'
-            },
-            {
-                'id': 'fghij',
-                'title': 'Another Video',
-                'url': 'https://www.xnxx.com/video-fghij/',
-                'thumbnail': 'https://www.xnxx.com/thumbs/fghij.jpg',
-                'duration': '5:00',
-                'source': 'XNXX',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+XNXX_VIDEO_MISSING_HTML = """
         <html><body>
             <div class="thumb">
                 <a href="/video-111/" title="Missing Duration">
@@ -812,43 +899,66 @@ class TestXnxxDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        # Expecting results, but duration might be 'N/A'
-        expected_results = [
-            {
-                'id': '111',
-                'title': 'Missing Duration',
-                'url': 'https://www.xnxx.com/video-111/',
-                'thumbnail': 'https://www.xnxx.com/thumbs/111.jpg',
-                'duration': 'N/A',
-                'source': 'XNXX',
-                'type': 'video'
-            }
-        ]
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            self.assertEqual(actual_results[0]['id'], expected_results[0]['id'])
-            self.assertEqual(actual_results[0]['title'], expected_results[0]['title'])
-            self.assertEqual(actual_results[0]['url'], expected_results[0]['url'])
-            self.assertEqual(actual_results[0]['thumbnail'], expected_results[0]['thumbnail'])
-            self.assertEqual(actual_results[0]['duration'], expected_results[0]['duration'])
-            self.assertEqual(actual_results[0]['source'], expected_results[0]['source'])
-            self.assertEqual(actual_results[0]['type'], expected_results[0]['type'])
 
 
-# --- Tests for XvideosDriver ---
+# Rows expected by test_video_parser_with_items
+XNXX_VIDEO_EXPECTED = [
+    {
+        'id': 'abcde',
+        'title': 'Test Video Title',
+        'url': 'https://www.xnxx.com/video-abcde/',
+        'thumbnail': 'https://www.xnxx.com/thumbs/abcde.jpg',
+        'duration': '10:30',
+        'source': 'XNXX',
+        'type': 'video'
+    },
+    {
+        'id': 'fghij',
+        'title': 'Another Video',
+        'url': 'https://www.xnxx.com/video-fghij/',
+        'thumbnail': 'https://www.xnxx.com/thumbs/fghij.jpg',
+        'duration': '5:00',
+        'source': 'XNXX',
+        'type': 'video'
+    },
+    {
+        'id': 'invalid',
+        'title': 'Invalid ID Video',
+        'url': 'https://www.xnxx.com/video-invalid/',
+        'thumbnail': 'https://www.xnxx.com/thumbs/invalid.jpg',
+        'duration': 'N/A',
+        'source': 'XNXX',
+        'type': 'video'
+    }
+]
+
+
+# Rows expected by test_video_parser_with_missing_elements
+XNXX_VIDEO_MISSING_EXPECTED = [
+    {
+        'id': '111',
+        'title': 'Missing Duration',
+        'url': 'https://www.xnxx.com/video-111/',
+        'thumbnail': 'https://www.xnxx.com/thumbs/111.jpg',
+        'duration': 'N/A',
+        'source': 'XNXX',
+        'type': 'video'
+    }
+]
 
-class TestXvideosDriver(unittest.TestCase):
-    """Tests for the XvideosDriver."""
 
-    def setUp(self):
-        """Set up the XvideosDriver instance."""
-        self.driver = XvideosDriver()
-        self.base_url = 'https://www.xvideos.com'
+class TestXnxxDriver(unittest.TestCase):
+    """Tests for the XnxxDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one XnxxDriver instance shared by the read-only tests."""
+        cls.driver = XnxxDriver()
+        cls.base_url = 'https://www.xnxx.com'
 
     def test_name(self):
         """Test the name property."""
-        self.assertEqual(self.driver.name, 'Xvideos')
+        self.assertEqual(self.driver.name, 'XNXX')
 
     def test_first_page(self):
         """Test the first_page property."""
@@ -858,13 +968,13 @@ class TestXvideosDriver(unittest.TestCase):
         """Test the generation of video search URLs."""
         query = 'test search'
         page = 2
-        expected_url = 'https://www.xvideos.com/?k=test+search&p=2'
+        expected_url = 'https://www.xnxx.com/search/test%20search/2'
         self.assertEqual(self.driver.video_url(query, page), expected_url)
 
     def test_video_url_generation_default_page(self):
         """Test URL generation with default page."""
         query = 'another query'
-        expected_url = 'https://www.xvideos.com/?k=another%20query&p=0'
+        expected_url = 'https://www.xnxx.com/search/another%20query/0'
         self.assertEqual(self.driver.video_url(query, None), expected_url)
 
     def test_video_parser_no_items(self):
@@ -874,20 +984,53 @@ class TestXvideosDriver(unittest.TestCase):
 
     def test_video_parser_with_items(self):
         """Test parsing HTML with valid video items."""
+        html = XNXX_VIDEO_HTML
+        expected_results = XNXX_VIDEO_EXPECTED
+        # Rows carry exactly the expected keys, so compare the lists whole
+        self.assertEqual(self.driver.video_parser(html), expected_results)
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = XNXX_VIDEO_MISSING_HTML
+        # Expecting results, but duration might be 'N/A'
+        expected_results = XNXX_VIDEO_MISSING_EXPECTED
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIDEO_FIELDS), pick(expected, VIDEO_FIELDS))
+
+    def test_video_parser_limit_counts_results(self):
+        """Test that limit caps returned results, not scanned containers."""
         html = """
+        <html><body>
+            <div class="thumb"><a href="/ad-slot/"><img data-src="https://www.xnxx.com/ad.jpg"></a></div>
+            <div class="thumb"><a href="/video-aaa/" title="First"><img data-src="https://www.xnxx.com/thumbs/aaa.jpg"></a></div>
+            <div class="thumb"><a href="/video-bbb/" title="Second"><img data-src="https://www.xnxx.com/thumbs/bbb.jpg"></a></div>
+            <div class="thumb"><a href="/video-ccc/" title="Third"><img data-src="https://www.xnxx.com/thumbs/ccc.jpg"></a></div>
+        </body></html>
+        """
+        actual_results = self.driver.video_parser(html, limit=2)
+        self.assertEqual([res['id'] for res in actual_results], ['aaa', 'bbb'])
+
+
+# --- Tests for XvideosDriver ---
+
+# Search results page fixture for test_video_parser_with_items
+XVIDEOS_VIDEO_HTML = """
         <html><body>
             <div class="thumb-block">
                 <a href="/video12345/">
                     <img data-src="https://www.xvideos.com/thumbs/12345.jpg">
                     <p class="title">Test Video Title</p>
-                    <span class="duration">10:30</span>
+                    <p class="metadata">10:30</p>
                 </a>
             </div>
             <div class="thumb">
                 <a href="/video67890/">
                     <img src="https://www.xvideos.com/thumbs/67890.jpg">
                     <p class="title">Another Video</p>
-                    <span class="duration">5:00</span>
+                    <p class="metadata">5:00</p>
                 </a>
             </div>
             <div class="thumb-block"> <!-- Missing ID -->
@@ -898,78 +1041,123 @@ class TestXvideosDriver(unittest.TestCase):
             </div>
         </body></html>
         """
-        expected_results = [
-            {
-                'id': '12345',
-                'title': 'Test Video Title',
-                'url': 'https://www.xvideos.com/video12345/',
-                'thumbnail': 'https://www.xvideos.com/thumbs/12345.jpg',
-                'duration': '10:30',
-                'source': 'Xvideos',
-                'type': 'video'
-            },
-            {
-                'id': '67890',
-                'title': 'Another Video',
-                'url': 'https://www.xvideos.com/video67890/',
-                'thumbnail': 'https://www.xvideos.com/thumbs/67890.jpg',
-                'duration': '5:00',
-                'source': 'Xvideos',
-                'type': 'video'
-            }
-        ]
-        
-        # Mocking make_absolute
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            for i, res in enumerate(actual_results):
-                self.assertEqual(res['id'], expected_results[i]['id'])
-                self.assertEqual(res['title'], expected_results[i]['title'])
-                self.assertEqual(res['url'], expected_results[i]['url'])
-                self.assertEqual(res['thumbnail'], expected_results[i]['thumbnail'])
-                self.assertEqual(res['duration'], expected_results[i]['duration'])
-                self.assertEqual(res['source'], expected_results[i]['source'])
-                self.assertEqual(res['type'], expected_results[i]['type'])
 
-    def test_video_parser_with_missing_elements(self):
-        """Test parsing HTML where some elements are missing."""
-        html = """
+
+# Results page fixture with incomplete items for test_video_parser_with_missing_elements
+XVIDEOS_VIDEO_MISSING_HTML = """
         <html><body>
             <div class="thumb-block">
-                <a href="/video/111/" title="Missing Duration">
+                <a href="/video111/" title="Missing Duration">
                     <img data-src="https://www.xvideos.com/thumbs/111.jpg">
                 </a>
             </div>
             <div class="thumb"> <!-- Missing title, duration -->
-                <a href="/video/222/">
+                <a href="/video222/">
                     <img data-src="https://www.xvideos.com/thumbs/222.jpg">
                 </a>
             </div>
         </body></html>
         """
+
+
+# Rows expected by test_video_parser_with_items
+XVIDEOS_VIDEO_EXPECTED = [
+    {
+        'id': '12345',
+        'title': 'Test Video Title',
+        'url': 'https://www.xvideos.com/video12345/',
+        'thumbnail': 'https://www.xvideos.com/thumbs/12345.jpg',
+        'duration': '10:30',
+        'source': 'Xvideos',
+        'type': 'video'
+    },
+    {
+        'id': '67890',
+        'title': 'Another Video',
+        'url': 'https://www.xvideos.com/video67890/',
+        'thumbnail': 'https://www.xvideos.com/thumbs/67890.jpg',
+        'duration': '5:00',
+        'source': 'Xvideos',
+        'type': 'video'
+    }
+]
+
+
+# Rows expected by test_video_parser_with_missing_elements
+XVIDEOS_VIDEO_MISSING_EXPECTED = [
+    {
+        'id': '111',
+        'title': 'Missing Duration',
+        'url': 'https://www.xvideos.com/video111/',
+        'thumbnail': 'https://www.xvideos.com/thumbs/111.jpg',
+        'duration': 'N/A',
+        'source': 'Xvideos',
+        'type': 'video'
+    },
+    {
+        'id': '222',
+        'title': 'Untitled Video',
+        'url': 'https://www.xvideos.com/video222/',
+        'thumbnail': 'https://www.xvideos.com/thumbs/222.jpg',
+        'duration': 'N/A',
+        'source': 'Xvideos',
+        'type': 'video'
+    }
+]
+
+
+class TestXvideosDriver(unittest.TestCase):
+    """Tests for the XvideosDriver."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one XvideosDriver instance shared by the read-only tests."""
+        cls.driver = XvideosDriver()
+        cls.base_url = 'https://www.xvideos.com'
+
+    def test_name(self):
+        """Test the name property."""
+        self.assertEqual(self.driver.name, 'Xvideos')
+
+    def test_first_page(self):
+        """Test the first_page property."""
+        self.assertEqual(self.driver.first_page, 0)
+
+    def test_video_url_generation(self):
+        """Test the generation of video search URLs."""
+        query = 'test search'
+        page = 2
+        expected_url = 'https://www.xvideos.com/?k=test+search&p=2'
+        self.assertEqual(self.driver.video_url(query, page), expected_url)
+
+    def test_video_url_generation_default_page(self):
+        """Test URL generation with default page."""
+        query = 'another query'
+        expected_url = 'https://www.xvideos.com/?k=another+query&p=0'
+        self.assertEqual(self.driver.video_url(query, None), expected_url)
+
+    def test_video_parser_no_items(self):
+        """Test parsing HTML with no video items."""
+        html = '<html><body>No videos found</body></html>'
+        self.assertEqual(self.driver.video_parser(html), [])
+
+    def test_video_parser_with_items(self):
+        """Test parsing HTML with valid video items."""
+        html = XVIDEOS_VIDEO_HTML
+        expected_results = XVIDEOS_VIDEO_EXPECTED
+        # Rows carry exactly the expected keys, so compare the lists whole
+        self.assertEqual(self.driver.video_parser(html), expected_results)
+
+    def test_video_parser_with_missing_elements(self):
+        """Test parsing HTML where some elements are missing."""
+        html = XVIDEOS_VIDEO_MISSING_HTML
         # Expecting results, but duration might be 'N/A'
-        expected_results = [
-            {
-                'id': '111',
-                'title': 'Missing Duration',
-                'url': 'https://www.xvideos.com/video/111/',
-                'thumbnail': 'https://www.xvideos.com/thumbs/111.jpg',
-                'duration': 'N/A',
-                'source': 'Xvideos',
-                'type': 'video'
-            }
-        ]
-        with patch.object(self.driver, 'make_absolute', side_effect=lambda url, base: urljoin(base, url) if url else None):
-            actual_results = self.driver.video_parser(html)
-            self.assertEqual(len(actual_results), len(expected_results))
-            self.assertEqual(actual_results[0]['id'], expected_results[0]['id'])
-            self.assertEqual(actual_results[0]['title'], expected_results[0]['title'])
-            self.assertEqual(actual_results[0]['url'], expected_results[0]['url'])
-            self.assertEqual(actual_results[0]['thumbnail'], expected_results[0]['thumbnail'])
-            self.assertEqual(actual_results[0]['duration'], expected_results[0]['duration'])
-            self.assertEqual(actual_results[0]['source'], expected_results[0]['source'])
-            self.assertEqual(actual_results[0]['type'], expected_results[0]['type'])
+        expected_results = XVIDEOS_VIDEO_MISSING_EXPECTED
+        actual_results = self.driver.video_parser(html)
+        self.assertEqual(len(actual_results), len(expected_results))
+        for i, (res, expected) in enumerate(zip(actual_results, expected_results)):
+            with self.subTest(i=i):
+                self.assertDictEqual(pick(res, VIDEO_FIELDS), pick(expected, VIDEO_FIELDS))
 
 
 if __name__ == '__main__':